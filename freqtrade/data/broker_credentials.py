@@ -4,17 +4,23 @@ import json
 import logging
 import os
 from datetime import datetime
+from threading import Lock
 from typing import Dict, List, Optional, Tuple
+
+from cachetools import TTLCache
 from cryptography.fernet import Fernet
 from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from freqtrade.exceptions import OperationalException
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds a broker connection test result is reused for
+VALIDATION_CACHE_TTL = 30
+
 Base = declarative_base()
 
 
@@ -54,8 +60,14 @@ class BrokerCredentialManager:
         self._engine = create_engine(db_url)
         Base.metadata.create_all(self._engine)
         
-        Session = sessionmaker(bind=self._engine)
-        self._session = Session()
+        # One session per thread, so a single manager can serve concurrent API requests.
+        # Every public method removes its session when done, so no thread keeps stale rows
+        # after another thread updated or re-encrypted the credentials.
+        self._session = scoped_session(sessionmaker(bind=self._engine))
+        
+        # Recent connection test results, by broker name
+        self._validation_cache: TTLCache = TTLCache(maxsize=64, ttl=VALIDATION_CACHE_TTL)
+        self._validation_lock = Lock()
         
         logger.info("BrokerCredentialManager initialized")
     
@@ -121,6 +133,7 @@ class BrokerCredentialManager:
                 self._session.add(credential_model)
             
             self._session.commit()
+            self._invalidate_validation(broker_name)
             logger.info(f"Stored credentials for broker: {broker_name}")
             return True
             
@@ -128,6 +141,8 @@ class BrokerCredentialManager:
             logger.error(f"Failed to store credentials for {broker_name}: {e}")
             self._session.rollback()
             return False
+        finally:
+            self._session.remove()
     
     def retrieve_credentials(self, broker_name: str) -> Optional[Dict]:
         """
@@ -155,6 +170,8 @@ class BrokerCredentialManager:
         except Exception as e:
             logger.error(f"Failed to retrieve credentials for {broker_name}: {e}")
             return None
+        finally:
+            self._session.remove()
     
     def delete_credentials(self, broker_name: str) -> bool:
         """
@@ -172,6 +189,7 @@ class BrokerCredentialManager:
                 credential_model.is_active = False
                 credential_model.updated_at = datetime.utcnow()
                 self._session.commit()
+                self._invalidate_validation(broker_name)
                 logger.info(f"Deleted credentials for broker: {broker_name}")
                 return True
             
@@ -181,6 +199,8 @@ class BrokerCredentialManager:
             logger.error(f"Failed to delete credentials for {broker_name}: {e}")
             self._session.rollback()
             return False
+        finally:
+            self._session.remove()
     
     def list_brokers(self) -> List[Dict]:
         """
@@ -208,14 +228,44 @@ class BrokerCredentialManager:
         except Exception as e:
             logger.error(f"Failed to list brokers: {e}")
             return []
+        finally:
+            self._session.remove()
     
-    def validate_credentials(self, broker_name: str) -> Tuple[bool, str]:
+    def validate_credentials(self, broker_name: str, use_cache: bool = True) -> Tuple[bool, str]:
         """
         Validate broker credentials by testing connection.
         
+        Results are reused for VALIDATION_CACHE_TTL seconds, until the credentials change.
+        
         :param broker_name: Name of the broker
+        :param use_cache: Reuse a recent result instead of testing the connection again
         :return: Tuple of (is_valid, error_message)
         """
+        if use_cache:
+            with self._validation_lock:
+                result = self._validation_cache.get(broker_name)
+            if result is not None:
+                return result
+        
+        result = self._validate_credentials(broker_name)
+        with self._validation_lock:
+            self._validation_cache[broker_name] = result
+        return result
+    
+    def _invalidate_validation(self, broker_name: Optional[str] = None):
+        """
+        Drop cached connection test results.
+        
+        :param broker_name: Name of the broker, None for all brokers
+        """
+        with self._validation_lock:
+            if broker_name is None:
+                self._validation_cache.clear()
+            else:
+                self._validation_cache.pop(broker_name, None)
+    
+    def _validate_credentials(self, broker_name: str) -> Tuple[bool, str]:
+        """Test the broker connection with the stored credentials"""
         try:
             credentials = self.retrieve_credentials(broker_name)
             if not credentials:
@@ -357,6 +407,7 @@ class BrokerCredentialManager:
             
             # Commit changes
             self._session.commit()
+            self._invalidate_validation()
             
             logger.info("Successfully rotated encryption key")
             return True
@@ -365,8 +416,11 @@ class BrokerCredentialManager:
             logger.error(f"Failed to rotate encryption key: {e}")
             self._session.rollback()
             return False
+        finally:
+            self._session.remove()
     
     def close(self):
-        """Close database session"""
+        """Close database sessions"""
         if self._session:
-            self._session.close()
+            self._session.remove()
+            self._engine.dispose()
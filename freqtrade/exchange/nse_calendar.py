@@ -5,7 +5,7 @@ Provides utilities to check NSE market hours and trading holidays.
 """
 
 import logging
-from datetime import datetime, time as dt_time
+from datetime import date, datetime, time as dt_time
 from typing import List, Optional, Set
 
 logger = logging.getLogger(__name__)
@@ -87,6 +87,10 @@ class NSECalendar:
         self._holidays: Set[str] = set()
         self._holidays.update(self.HOLIDAYS_2024)
         self._holidays.update(self.HOLIDAYS_2025)
+        # Parsed once so market-hours checks compare dates instead of formatting strings
+        self._holiday_dates: Set[date] = {
+            date.fromisoformat(holiday) for holiday in self._holidays
+        }
 
         logger.info(f"NSE calendar initialized with {len(self._holidays)} holidays")
 
@@ -112,8 +116,7 @@ class NSECalendar:
             return False
 
         # Check if it's a holiday
-        date_str = check_time.strftime('%Y-%m-%d')
-        if date_str in self._holidays:
+        if check_time.date() in self._holiday_dates:
             return False
 
         # Check market hours
@@ -148,8 +151,7 @@ class NSECalendar:
             return False
 
         # Check holiday
-        date_str = check_date.strftime('%Y-%m-%d')
-        return date_str not in self._holidays
+        return check_date.date() not in self._holiday_dates
 
     def get_next_trading_day(self, from_date: Optional[datetime] = None) -> datetime:
         """
@@ -199,8 +201,9 @@ class NSECalendar:
         """
         # Validate format
         try:
-            datetime.strptime(date_str, '%Y-%m-%d')
+            holiday_date = datetime.strptime(date_str, '%Y-%m-%d').date()
             self._holidays.add(date_str)
+            self._holiday_dates.add(holiday_date)
             logger.info(f"Added holiday: {date_str}")
         except ValueError:
             logger.error(f"Invalid date format: {date_str}, expected YYYY-MM-DD")
@@ -213,6 +216,7 @@ class NSECalendar:
         """
         if date_str in self._holidays:
             self._holidays.remove(date_str)
+            self._holiday_dates.discard(date.fromisoformat(date_str))
             logger.info(f"Removed holiday: {date_str}")
 
     def time_until_market_open(self, check_time: Optional[datetime] = None) -> Optional[int]:
@@ -5,10 +5,12 @@ import logging
 import os
 import random
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -17,11 +19,24 @@ from freqtrade.enums import CandleType, MarginMode, TradingMode
 from freqtrade.exceptions import ExchangeError, InsufficientFundsError, InvalidOrderException
 from freqtrade.exchange import Exchange
 from freqtrade.exchange.exchange_types import FtHas, OrderBook, Ticker
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_minutes
 from freqtrade.exchange.symbol_mapper import get_symbol_mapper
 
 
 logger = logging.getLogger(__name__)
 
+# Number of simulated candles kept per (pair, timeframe, candle_type)
+KLINE_BUFFER_SIZE = 1000
+_KLINE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+PAPERBROKER_TIMEFRAMES = [
+    '1m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w'
+]
+# Timeframe -> minutes, parsed once at import time for the simulation hot paths
+_TIMEFRAME_MINUTES = {
+    tf: timeframe_to_minutes(tf) for tf in (*PAPERBROKER_TIMEFRAMES, '3m', '10m')
+}
+
 
 class Paperbroker(Exchange):
     """
@@ -65,6 +80,22 @@ class Paperbroker(Exchange):
         (TradingMode.SPOT, MarginMode.NONE),
     ]
 
+    # Paper broker is a virtual exchange that supports common operations
+    _supported_endpoints = frozenset({
+        'fetchOHLCV',
+        'fetchTicker',
+        'fetchTickers',
+        'fetchOrderBook',
+        'createOrder',
+        'cancelOrder',
+        'fetchOrder',
+        'fetchOrders',
+        'fetchOpenOrders',
+        'fetchClosedOrders',
+        'fetchBalance',
+        'fetchMyTrades',
+    })
+
     def __init__(self, config, validate: bool = True, exchange_config=None, load_leverage_tiers: bool = False, **kwargs):
         """
         Initialize Paper Broker.
@@ -75,6 +106,7 @@ class Paperbroker(Exchange):
         - commission_percent: Trading commission (default: 0.1%)
         - fill_probability: Probability of order fill (default: 0.95)
         - proxy_exchange: Real exchange to get data from (optional)
+        - trade_history_max: Number of trades kept in trade history (default: 100000)
         """
         # Initialize minimal Exchange attributes without CCXT
         from threading import Lock
@@ -95,6 +127,7 @@ class Paperbroker(Exchange):
         self._exit_rate_cache = TTLCache(maxsize=100, ttl=300)
         self._entry_rate_cache = TTLCache(maxsize=100, ttl=300)
         self._klines = {}
+        self._kline_buffers = {}  # cache_key -> ring buffer backing self._klines
         self._expiring_candle_cache = {}
         self._trades = {}
         self._dry_run_open_orders = {}
@@ -119,8 +152,10 @@ class Paperbroker(Exchange):
         self._initial_balance = exchange_config.get('initial_balance', 100000.0)
         self._slippage_percent = exchange_config.get('slippage_percent', 0.05)
         self._commission_percent = exchange_config.get('commission_percent', 0.1)
+        self._fee_rate = self._commission_percent / 100
         self._fill_probability = exchange_config.get('fill_probability', 0.95)
         self._proxy_exchange = exchange_config.get('proxy_exchange', None)
+        self._trade_history_max = exchange_config.get('trade_history_max', 100000)
         
         # Virtual account state
         self._balance = {
@@ -131,14 +166,17 @@ class Paperbroker(Exchange):
             }
         }
         
+        # Last balance built by fetch_balance(), None when it must be rebuilt
+        self._balance_cache: dict | None = None
+        
         # Order tracking
-        self._orders = {}  # order_id -> order_data
-        self._open_orders = {}  # order_id -> order_data
-        self._filled_orders = {}  # order_id -> order_data
-        self._positions = {}  # pair -> position_data
+        self._orders = {}  # order_id -> order_data (single source of truth)
+        self._open_order_ids = set()  # ids of open orders in self._orders
+        self._filled_order_ids = set()  # ids of filled orders in self._orders
+        self._positions = {}  # pair -> position_data (amount, cost, base currency)
         
-        # Trade history
-        self._trade_history = []
+        # Trade history (bounded - oldest entries are dropped first)
+        self._trade_history = deque(maxlen=self._trade_history_max)
         
         # Price cache for simulation
         self._price_cache = {}  # pair -> last_price
@@ -318,17 +356,14 @@ class Paperbroker(Exchange):
                 pair = trade.pair
                 amount = trade.amount
                 
-                # Initialize position if not exists
-                if pair not in self._positions:
-                    self._positions[pair] = {'amount': 0, 'cost': 0}
+                # Add to position (initialized if not exists)
+                position = self._get_or_create_position(pair)
+                position['amount'] += amount
+                position['cost'] += (trade.open_rate * amount)
                 
-                # Add to position
-                self._positions[pair]['amount'] += amount
-                self._positions[pair]['cost'] += (trade.open_rate * amount)
-                
-                logger.debug(
-                    f"Restored position: {pair} = {amount} units @ {trade.open_rate}"
-                )
+                logger.debug("Restored position: %s = %s units @ %s", pair, amount, trade.open_rate)
+            
+            self._invalidate_balance()
             
             # Update balance to reflect used capital
             total_used = sum(pos['cost'] for pos in self._positions.values())
@@ -345,6 +380,22 @@ class Paperbroker(Exchange):
         except Exception as e:
             logger.error(f"Error restoring positions from database: {e}")
 
+    def _get_or_create_position(self, pair: str) -> dict:
+        """
+        Get the position for a pair, creating an empty one if needed.
+        
+        :param pair: Trading pair
+        :return: Position data (amount, cost, base currency)
+        """
+        position = self._positions.get(pair)
+        if position is None:
+            position = self._positions[pair] = {
+                'amount': 0,
+                'cost': 0,
+                'base': pair.split('/', 1)[0],
+            }
+        return position
+
     def _simulate_price(self, pair: str, base_price: float | None = None) -> float:
         """
         Simulate a realistic price for a pair.
@@ -405,7 +456,7 @@ class Paperbroker(Exchange):
         :param amount: Trade amount
         :return: Commission amount
         """
-        return amount * (self._commission_percent / 100)
+        return amount * self._fee_rate
 
     def fetch_ticker(self, pair: str) -> Ticker:
         """
@@ -483,12 +534,13 @@ class Paperbroker(Exchange):
             bid_qty = random.uniform(10, 1000)
             bids.append((bid_price, bid_qty))
         
+        now = datetime.now()
         return {
             'symbol': pair,
             'bids': bids,
             'asks': asks,
-            'timestamp': int(datetime.now().timestamp() * 1000),
-            'datetime': datetime.now().isoformat(),
+            'timestamp': int(now.timestamp() * 1000),
+            'datetime': now.isoformat(),
             'nonce': None,
         }
     
@@ -535,10 +587,7 @@ class Paperbroker(Exchange):
         limit = limit or 100
         
         # Convert timeframe to minutes
-        timeframe_minutes = {
-            '1m': 1, '3m': 3, '5m': 5, '10m': 10,
-            '15m': 15, '30m': 30, '1h': 60, '1d': 1440
-        }.get(timeframe, 5)
+        timeframe_minutes = _TIMEFRAME_MINUTES.get(timeframe, 5)
         
         # Start time
         if since:
@@ -627,8 +676,8 @@ class Paperbroker(Exchange):
         # Log sample data for debugging
         if ohlcv:
             logger.debug(
-                f"Returning {len(ohlcv)} candles for {pair} ({timeframe}) from CSV data. "
-                f"First candle: {ohlcv[0]}, Last candle: {ohlcv[-1]}"
+                "Returning %s candles for %s (%s) from CSV data. First candle: %s, Last candle: %s",
+                len(ohlcv), pair, timeframe, ohlcv[0], ohlcv[-1]
             )
         
         return ohlcv
@@ -671,7 +720,9 @@ class Paperbroker(Exchange):
             resampled['datetime'] = resampled['datetime'].dt.tz_localize('UTC')
         resampled['timestamp'] = (resampled['datetime'].astype(int) // 10**6).astype(int)
         
-        logger.debug(f"Resampled {len(df_copy)} candles to {len(resampled)} {timeframe} candles")
+        logger.debug(
+            "Resampled %s candles to %s %s candles", len(df_copy), len(resampled), timeframe
+        )
         
         return resampled
 
@@ -756,10 +807,11 @@ class Paperbroker(Exchange):
         will_fill = True
         
         # Create order
+        now = datetime.now()
         order = {
             'id': order_id,
-            'timestamp': int(datetime.now().timestamp() * 1000),
-            'datetime': datetime.now().isoformat(),
+            'timestamp': int(now.timestamp() * 1000),
+            'datetime': now.isoformat(),
             'status': 'closed' if will_fill else 'open',
             'symbol': pair,
             'type': ordertype,
@@ -784,27 +836,28 @@ class Paperbroker(Exchange):
         self._orders[order_id] = order
         
         if order['status'] == 'open':
-            self._open_orders[order_id] = order
+            self._open_order_ids.add(order_id)
             # Reserve funds for buy orders
             if side == 'buy':
                 self._balance['INR']['free'] -= total_cost
                 self._balance['INR']['used'] += total_cost
         else:
-            self._filled_orders[order_id] = order
+            self._filled_order_ids.add(order_id)
             # Update balance
             if side == 'buy':
                 self._balance['INR']['free'] -= total_cost
                 # Update position
-                if pair not in self._positions:
-                    self._positions[pair] = {'amount': 0, 'cost': 0}
-                self._positions[pair]['amount'] += amount
-                self._positions[pair]['cost'] += order_value
+                position = self._get_or_create_position(pair)
+                position['amount'] += amount
+                position['cost'] += order_value
             else:
                 self._balance['INR']['free'] += (order_value - commission)
                 # Update position
                 if pair in self._positions:
                     self._positions[pair]['amount'] -= amount
         
+        self._invalidate_balance()
+        
         # Log trade
         self._trade_history.append({
             'order_id': order_id,
@@ -854,6 +907,19 @@ class Paperbroker(Exchange):
         
         return sorted(orders, key=lambda x: x['timestamp'])
 
+    def fetch_open_orders(self, pair: str | None = None) -> list[dict]:
+        """
+        Fetch currently open orders.
+        
+        :param pair: Freqtrade pair (None for all pairs)
+        :return: List of open orders
+        """
+        orders = self._orders
+        open_orders = (orders[order_id] for order_id in self._open_order_ids)
+        if pair is None:
+            return list(open_orders)
+        return [order for order in open_orders if order['symbol'] == pair]
+
     def cancel_order(self, order_id: str, pair: str, params: dict | None = None) -> dict:
         """
         Cancel an order.
@@ -876,13 +942,13 @@ class Paperbroker(Exchange):
         
         # Release reserved funds
         if order['side'] == 'buy':
-            reserved = order['cost'] + self._calculate_commission(order['cost'])
+            reserved = order['cost'] + order['fee']['cost']
             self._balance['INR']['free'] += reserved
             self._balance['INR']['used'] -= reserved
+            self._invalidate_balance()
         
         # Remove from open orders
-        if order_id in self._open_orders:
-            del self._open_orders[order_id]
+        self._open_order_ids.discard(order_id)
         
         return order
 
@@ -897,28 +963,41 @@ class Paperbroker(Exchange):
             self._restore_positions_from_db()
             self._positions_restored = True
         
-        # DEBUG: Log current positions
-        logger.debug(f"Paper Broker positions: {self._positions}")
+        # Balances are polled far more often than orders change them
+        if self._balance_cache is not None:
+            return self._balance_cache
+        
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("Paper Broker positions: %s", self._positions)
         
+        inr_balance = self._balance['INR']
+        free = {'INR': inr_balance['free']}
+        used = {'INR': inr_balance['used']}
+        total = {'INR': inr_balance['total']}
         balance = {
-            'INR': self._balance['INR'],
+            'INR': inr_balance,
             'info': {
                 'initial_balance': self._initial_balance,
                 'total_trades': len(self._trade_history),
                 'open_positions': len(self._positions)
             },
-            'free': {'INR': self._balance['INR']['free']},
-            'used': {'INR': self._balance['INR']['used']},
-            'total': {'INR': self._balance['INR']['total']},
+            'free': free,
+            'used': used,
+            'total': total,
         }
         
         # Add stock positions to balance
         for pair, position in self._positions.items():
-            # Extract base currency (e.g., "RELIANCE" from "RELIANCE/INR")
-            base_currency = pair.split('/')[0]
+            # Base currency (e.g., "RELIANCE" from "RELIANCE/INR"), cached on the position
+            base_currency = position.get('base')
+            if base_currency is None:
+                base_currency = position['base'] = pair.split('/', 1)[0]
             amount = position.get('amount', 0)
             
-            logger.debug(f"Position {pair}: amount={amount}, base_currency={base_currency}")
+            if debug_enabled:
+                logger.debug(
+                    "Position %s: amount=%s, base_currency=%s", pair, amount, base_currency
+                )
             
             if amount > 0:
                 balance[base_currency] = {
@@ -927,16 +1006,22 @@ class Paperbroker(Exchange):
                     'total': amount
                 }
                 # Also add to free/used/total dicts
-                balance['free'][base_currency] = amount
-                balance['used'][base_currency] = 0.0
-                balance['total'][base_currency] = amount
+                free[base_currency] = amount
+                used[base_currency] = 0.0
+                total[base_currency] = amount
         
-        logger.debug(f"Paper Broker balance returned: {list(balance.keys())}")
+        if debug_enabled:
+            logger.debug("Paper Broker balance returned: %s", list(balance.keys()))
+        self._balance_cache = balance
         return balance
 
+    def _invalidate_balance(self) -> None:
+        """Drop the cached balance - call after any change to balance or positions"""
+        self._balance_cache = None
+
     def get_trade_history(self) -> list:
-        """Get complete trade history"""
-        return self._trade_history
+        """Get trade history (up to the last `trade_history_max` trades)"""
+        return list(self._trade_history)
 
     def get_positions(self) -> dict:
         """Get current positions"""
@@ -951,6 +1036,7 @@ class Paperbroker(Exchange):
                 'total': self._initial_balance
             }
         }
+        self._invalidate_balance()
         
         # Initialize market data
         self._markets = {}
@@ -983,6 +1069,7 @@ class Paperbroker(Exchange):
         self._ohlcv_candle_cache = {}
         self._price_cache = {}
         self._klines = {}
+        self._kline_buffers = {}
         self._expiring_candle_cache = {}
         self._fetch_tickers_cache.clear()
         self._exit_rate_cache.clear()
@@ -1027,7 +1114,7 @@ class Paperbroker(Exchange):
     @property
     def timeframes(self) -> list:
         """Supported timeframes for Paper Broker"""
-        return ['1m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w']
+        return PAPERBROKER_TIMEFRAMES
     
     def get_markets(self, base_currencies: list | None = None,
                     quote_currencies: list | None = None,
@@ -1051,22 +1138,7 @@ class Paperbroker(Exchange):
 
     def exchange_has(self, endpoint: str) -> bool:
         """Check if exchange supports endpoint"""
-        # Paper broker is a virtual exchange that supports common operations
-        supported = {
-            'fetchOHLCV': True,
-            'fetchTicker': True,
-            'fetchTickers': True,
-            'fetchOrderBook': True,
-            'createOrder': True,
-            'cancelOrder': True,
-            'fetchOrder': True,
-            'fetchOrders': True,
-            'fetchOpenOrders': True,
-            'fetchClosedOrders': True,
-            'fetchBalance': True,
-            'fetchMyTrades': True,
-        }
-        return supported.get(endpoint, False)
+        return endpoint in self._supported_endpoints
     
     def validate_ordertypes(self, order_types: dict) -> None:
         """Validate order types"""
@@ -1090,7 +1162,7 @@ class Paperbroker(Exchange):
     def get_fee(self, symbol: str = '', type: str = '', side: str = '', amount: float = 1,
                 price: float = 1, taker_or_maker: str = 'maker') -> float:
         """Get trading fee"""
-        return self._commission_percent / 100
+        return self._fee_rate
     
     def get_min_pair_stake_amount(self, pair: str, price: float, stoploss: float,
                                     leverage: float = 1.0) -> float | None:
@@ -1111,10 +1183,6 @@ class Paperbroker(Exchange):
     
     def refresh_latest_ohlcv(self, pair_list: list[tuple[str, str, CandleType]]) -> None:
         """Refresh OHLCV data synchronously for Paper Broker - REAL-TIME UPDATES"""
-        import random
-        from datetime import datetime, timedelta
-        import pandas as pd
-        
         current_time = datetime.now()
         
         # Generate simulated OHLCV data for each pair
@@ -1122,34 +1190,25 @@ class Paperbroker(Exchange):
             # Create cache key
             cache_key = (pair, timeframe, candle_type)
             
-            # Parse timeframe to minutes
-            if timeframe.endswith('m'):
-                minutes = int(timeframe[:-1])
-            elif timeframe.endswith('h'):
-                minutes = int(timeframe[:-1]) * 60
-            elif timeframe.endswith('d'):
-                minutes = int(timeframe[:-1]) * 1440
-            else:
-                minutes = 5  # default
+            minutes = _TIMEFRAME_MINUTES.get(timeframe, 5)
             
             # Check if we already have data
-            if cache_key in self._klines and not self._klines[cache_key].empty:
+            buffer = self._kline_buffers.get(cache_key)
+            if buffer is not None and buffer['len'] > 0 and cache_key in self._klines:
                 # UPDATE EXISTING DATA - Add new candles if time has passed
-                df = self._klines[cache_key]
-                last_candle_time = df['date'].iloc[-1]
+                last_candle_ns = int(buffer['date'][(buffer['head'] - 1) % KLINE_BUFFER_SIZE])
                 
                 # Calculate how many new candles we need
-                time_diff = (current_time - last_candle_time.to_pydatetime().replace(tzinfo=None)).total_seconds() / 60
+                time_diff = (pd.Timestamp(current_time).value - last_candle_ns) / 60e9
                 new_candles_needed = int(time_diff / minutes)
                 
                 if new_candles_needed > 0:
                     # Get last close price for continuity
-                    last_close = df['close'].iloc[-1]
-                    new_candles = []
+                    last_close = float(buffer['close'][(buffer['head'] - 1) % KLINE_BUFFER_SIZE])
+                    step_ns = minutes * 60 * 10**9
+                    new_candles = np.empty((new_candles_needed, len(_KLINE_COLUMNS)))
                     
-                    for i in range(1, new_candles_needed + 1):
-                        timestamp = last_candle_time + pd.Timedelta(minutes=minutes * i)
-                        
+                    for i in range(new_candles_needed):
                         # Generate new candle with realistic price movement
                         volatility = last_close * 0.02  # 2% volatility
                         open_price = last_close + random.uniform(-volatility/2, volatility/2)
@@ -1158,71 +1217,122 @@ class Paperbroker(Exchange):
                         low_price = min(open_price, close_price) - random.uniform(0, volatility/2)
                         volume = random.uniform(100000, 1000000)
                         
-                        new_candles.append({
-                            'date': timestamp,
-                            'open': open_price,
-                            'high': high_price,
-                            'low': low_price,
-                            'close': close_price,
-                            'volume': volume
-                        })
+                        new_candles[i] = (open_price, high_price, low_price, close_price, volume)
                         
                         # Update for next candle
                         last_close = close_price
                     
-                    # Append new candles
-                    new_df = pd.DataFrame(new_candles)
-                    df = pd.concat([df, new_df], ignore_index=True)
-                    
-                    # Keep only last 1000 candles
-                    if len(df) > 1000:
-                        df = df.iloc[-1000:].reset_index(drop=True)
-                    
-                    self._klines[cache_key] = df
-                    logger.debug(f"Added {new_candles_needed} new candles for {pair} ({timeframe})")
+                    dates = last_candle_ns + step_ns * np.arange(
+                        1, new_candles_needed + 1, dtype=np.int64
+                    )
+                    # Append new candles in place (only the last 1000 are kept)
+                    self._append_kline_buffer(buffer, dates, new_candles)
+                    self._klines[cache_key] = self._kline_buffer_to_dataframe(buffer)
+                    logger.debug(
+                        "Added %s new candles for %s (%s)", new_candles_needed, pair, timeframe
+                    )
             else:
                 # INITIAL GENERATION - Create historical candles
-                base_price = random.uniform(100, 5000)  # Random starting price
-                candles = []
+                count = 500
+                # Columns: date (ms), open, high, low, close, volume
+                candles = np.empty((count, 6))
+                base_ms = int(current_time.timestamp() * 1000)
+                step_ms = minutes * 60_000
+                candles[:, 0] = base_ms - step_ms * np.arange(count, 0, -1, dtype=np.int64)
                 
-                for i in range(500):
-                    timestamp = int((current_time - timedelta(minutes=minutes * (500 - i))).timestamp() * 1000)
-                    
-                    # Generate realistic OHLCV
-                    volatility = base_price * 0.02  # 2% volatility
-                    open_price = base_price + random.uniform(-volatility, volatility)
-                    close_price = open_price + random.uniform(-volatility, volatility)
-                    high_price = max(open_price, close_price) + random.uniform(0, volatility/2)
-                    low_price = min(open_price, close_price) - random.uniform(0, volatility/2)
-                    volume = random.uniform(100000, 1000000)
-                    
-                    candles.append([
-                        timestamp,
-                        open_price,
-                        high_price,
-                        low_price,
-                        close_price,
-                        volume
-                    ])
-                    
-                    # Update base price for next candle (trend simulation)
-                    base_price = close_price
+                # Random walk (trend simulation): each candle opens and closes within 2%
+                # of the previous close, which becomes the base price of the next candle
+                open_moves = np.random.uniform(-0.02, 0.02, count)
+                close_moves = np.random.uniform(-0.02, 0.02, count)
+                growth = np.ones(count)
+                growth[1:] = 1 + open_moves[:-1] + close_moves[:-1]
+                base_prices = random.uniform(100, 5000) * np.cumprod(growth)
+                
+                candles[:, 1] = base_prices * (1 + open_moves)
+                candles[:, 4] = base_prices * (1 + open_moves + close_moves)
+                body_high = np.maximum(candles[:, 1], candles[:, 4])
+                body_low = np.minimum(candles[:, 1], candles[:, 4])
+                candles[:, 2] = body_high + base_prices * np.random.uniform(0, 0.01, count)
+                candles[:, 3] = body_low - base_prices * np.random.uniform(0, 0.01, count)
+                candles[:, 5] = np.random.uniform(100000, 1000000, count)
+                
+                dates = candles[:, 0].astype(np.int64) * 10**6  # ms -> ns
                 
                 # Convert to DataFrame format expected by Freqtrade
-                df = pd.DataFrame(candles, columns=['date', 'open', 'high', 'low', 'close', 'volume'])
-                df['date'] = pd.to_datetime(df['date'], unit='ms', utc=True)
+                df = DataFrame(
+                    {
+                        'date': pd.to_datetime(dates, unit='ns', utc=True),
+                        'open': candles[:, 1],
+                        'high': candles[:, 2],
+                        'low': candles[:, 3],
+                        'close': candles[:, 4],
+                        'volume': candles[:, 5],
+                    },
+                    copy=False,
+                )
+                
+                # Keep candles in a ring buffer for cheap incremental updates
+                buffer = self._new_kline_buffer()
+                self._append_kline_buffer(buffer, dates, candles[:, 1:])
+                self._kline_buffers[cache_key] = buffer
                 
                 # Store in _klines (this is what Freqtrade reads)
                 self._klines[cache_key] = df
                 
                 logger.info(f"Generated {len(df)} simulated candles for {pair} ({timeframe})")
     
+    @staticmethod
+    def _new_kline_buffer() -> dict[str, Any]:
+        """Create an empty fixed-size candle ring buffer (one array per column)"""
+        buffer: dict[str, Any] = {
+            'date': np.empty(KLINE_BUFFER_SIZE, dtype=np.int64),  # ns since epoch (UTC)
+            'head': 0,  # next slot to write
+            'len': 0,  # number of valid candles
+        }
+        for column in _KLINE_COLUMNS:
+            buffer[column] = np.empty(KLINE_BUFFER_SIZE, dtype=np.float64)
+        return buffer
+    
+    @staticmethod
+    def _append_kline_buffer(buffer: dict[str, Any], dates: np.ndarray, values: np.ndarray):
+        """
+        Write candles into the ring buffer in place, overwriting the oldest slots.
+        
+        :param buffer: Ring buffer created by _new_kline_buffer()
+        :param dates: Candle open times in ns since epoch, shape (k,)
+        :param values: open/high/low/close/volume values, shape (k, 5)
+        """
+        if len(dates) > KLINE_BUFFER_SIZE:
+            dates = dates[-KLINE_BUFFER_SIZE:]
+            values = values[-KLINE_BUFFER_SIZE:]
+        count = len(dates)
+        slots = (buffer['head'] + np.arange(count)) % KLINE_BUFFER_SIZE
+        buffer['date'][slots] = dates
+        for col_idx, column in enumerate(_KLINE_COLUMNS):
+            buffer[column][slots] = values[:, col_idx]
+        buffer['head'] = (buffer['head'] + count) % KLINE_BUFFER_SIZE
+        buffer['len'] = min(buffer['len'] + count, KLINE_BUFFER_SIZE)
+    
+    @staticmethod
+    def _kline_buffer_to_dataframe(buffer: dict[str, Any]) -> DataFrame:
+        """Materialize the ring buffer as a DataFrame ordered from oldest to newest candle"""
+        head = buffer['head']
+        if buffer['len'] < KLINE_BUFFER_SIZE:
+            order = slice(head - buffer['len'], head)
+            columns = {name: buffer[name][order].copy() for name in ('date', *_KLINE_COLUMNS)}
+        else:
+            # Rotate once at read time so the oldest candle comes first
+            columns = {
+                name: np.concatenate((buffer[name][head:], buffer[name][:head]))
+                for name in ('date', *_KLINE_COLUMNS)
+            }
+        columns['date'] = pd.to_datetime(columns['date'], unit='ns', utc=True)
+        return DataFrame(columns, copy=False)
+    
     def _get_candle_history_from_trades(
         self, pair: str, timeframe: str, since_ms: int
     ) -> list:
         """Get candle history from cache for Paper Broker"""
-        from freqtrade.enums import CandleType
-        
         cache_key = (pair, timeframe, CandleType.SPOT)
         
         if cache_key not in self._ohlcv_candle_cache:
@@ -7,8 +7,8 @@ with broker rate limits and prevent DDos protection triggers.
 
 import logging
 import time
+from bisect import bisect_left
 from collections import deque
-from datetime import datetime
 from threading import Lock
 from typing import Dict, Optional
 
@@ -51,7 +51,7 @@ class RateLimiter:
 
         # Request history tracking
         self._request_times: deque = deque()
-        self._last_request_time: float = 0.0
+        self._last_request_time: float = float('-inf')  # monotonic clock
         self._lock = Lock()
 
         # Statistics
@@ -76,54 +76,72 @@ class RateLimiter:
         :return: Wait time in seconds
         """
         with self._lock:
-            current_time = time.time()
-            wait_time = 0.0
-
-            # Clean old request times
-            self._cleanup_old_requests(current_time)
-
-            # Check minimum interval
-            if self.min_request_interval > 0:
-                time_since_last = current_time - self._last_request_time
-                if time_since_last < self.min_request_interval:
-                    interval_wait = self.min_request_interval - time_since_last
-                    wait_time = max(wait_time, interval_wait)
-
-            # Check per-second limit
-            if self.requests_per_second:
-                second_wait = self._check_limit(current_time, 1.0, self.requests_per_second)
-                wait_time = max(wait_time, second_wait)
-
-            # Check per-minute limit
-            if self.requests_per_minute:
-                minute_wait = self._check_limit(current_time, 60.0, self.requests_per_minute)
-                wait_time = max(wait_time, minute_wait)
-
-            # Check per-hour limit
-            if self.requests_per_hour:
-                hour_wait = self._check_limit(current_time, 3600.0, self.requests_per_hour)
-                wait_time = max(wait_time, hour_wait)
-
-            # Check per-day limit
-            if self.requests_per_day:
-                day_wait = self._check_limit(current_time, 86400.0, self.requests_per_day)
-                wait_time = max(wait_time, day_wait)
+            current_time = time.monotonic()
+            wait_time = self._compute_wait_unlocked(current_time)
 
             # Wait if needed
             if wait_time > 0:
-                self._rate_limit_hits += 1
-                self._total_wait_time += wait_time
+                self._note_wait_unlocked(wait_time)
                 logger.debug(f"Rate limit: waiting {wait_time:.3f}s before request")
                 time.sleep(wait_time)
-                current_time = time.time()
+                current_time = time.monotonic()
 
-            # Record request
-            self._request_times.append(current_time)
-            self._last_request_time = current_time
-            self._total_requests += 1
+            self._record_unlocked(current_time)
 
             return wait_time
 
+    def _compute_wait_unlocked(self, current_time: float) -> float:
+        """
+        Compute the wait needed before a request at current_time. Caller must hold the lock.
+
+        :param current_time: Current timestamp
+        :return: Wait time in seconds (0 if no wait needed)
+        """
+        wait_time = 0.0
+
+        # Clean old request times
+        self._cleanup_old_requests(current_time)
+
+        # Check minimum interval
+        if self.min_request_interval > 0:
+            time_since_last = current_time - self._last_request_time
+            if time_since_last < self.min_request_interval:
+                interval_wait = self.min_request_interval - time_since_last
+                wait_time = max(wait_time, interval_wait)
+
+        # Check per-second limit
+        if self.requests_per_second:
+            second_wait = self._check_limit(current_time, 1.0, self.requests_per_second)
+            wait_time = max(wait_time, second_wait)
+
+        # Check per-minute limit
+        if self.requests_per_minute:
+            minute_wait = self._check_limit(current_time, 60.0, self.requests_per_minute)
+            wait_time = max(wait_time, minute_wait)
+
+        # Check per-hour limit
+        if self.requests_per_hour:
+            hour_wait = self._check_limit(current_time, 3600.0, self.requests_per_hour)
+            wait_time = max(wait_time, hour_wait)
+
+        # Check per-day limit
+        if self.requests_per_day:
+            day_wait = self._check_limit(current_time, 86400.0, self.requests_per_day)
+            wait_time = max(wait_time, day_wait)
+
+        return wait_time
+
+    def _note_wait_unlocked(self, wait_time: float):
+        """Update rate limit statistics for a wait. Caller must hold the lock."""
+        self._rate_limit_hits += 1
+        self._total_wait_time += wait_time
+
+    def _record_unlocked(self, current_time: float):
+        """Record a request. Caller must hold the lock."""
+        self._request_times.append(current_time)
+        self._last_request_time = current_time
+        self._total_requests += 1
+
     def _cleanup_old_requests(self, current_time: float):
         """Remove request times older than longest period"""
         max_period = 86400.0  # 1 day
@@ -151,12 +169,18 @@ class RateLimiter:
         """
         cutoff_time = current_time - period
 
-        # Count requests in period
-        requests_in_period = sum(1 for t in self._request_times if t >= cutoff_time)
+        # Request times are recorded in ascending order, so walk back from the newest one
+        # and stop at the first request outside the period - this only visits the requests
+        # in the period instead of the whole (up to one day long) history.
+        requests_in_period = 0
+        oldest_in_period = current_time
+        for t in reversed(self._request_times):
+            if t < cutoff_time:
+                break
+            requests_in_period += 1
+            oldest_in_period = t
 
         if requests_in_period >= limit:
-            # Find oldest request in period
-            oldest_in_period = min((t for t in self._request_times if t >= cutoff_time), default=current_time)
             wait_time = (oldest_in_period + period) - current_time
             return max(0.0, wait_time + 0.01)  # Add 10ms buffer
 
@@ -164,28 +188,41 @@ class RateLimiter:
 
     def get_stats(self) -> Dict[str, any]:
         """Get rate limiter statistics"""
+        # Snapshot the history under a brief lock, then count without holding it.
+        # The counters are plain int/float attributes, read atomically under the GIL.
         with self._lock:
-            return {
-                'total_requests': self._total_requests,
-                'total_wait_time': self._total_wait_time,
-                'rate_limit_hits': self._rate_limit_hits,
-                'avg_wait_time': self._total_wait_time / max(1, self._rate_limit_hits),
-                'requests_last_second': self._count_requests_in_period(1.0),
-                'requests_last_minute': self._count_requests_in_period(60.0),
-                'requests_last_hour': self._count_requests_in_period(3600.0),
-            }
-
-    def _count_requests_in_period(self, period: float) -> int:
-        """Count requests in the last N seconds"""
-        current_time = time.time()
-        cutoff_time = current_time - period
-        return sum(1 for t in self._request_times if t >= cutoff_time)
+            request_times = tuple(self._request_times)
+        current_time = time.monotonic()
+        total_wait_time = self._total_wait_time
+        rate_limit_hits = self._rate_limit_hits
+        return {
+            'total_requests': self._total_requests,
+            'total_wait_time': total_wait_time,
+            'rate_limit_hits': rate_limit_hits,
+            'avg_wait_time': total_wait_time / max(1, rate_limit_hits),
+            'requests_last_second': self._count_requests_in_period(
+                request_times, current_time, 1.0
+            ),
+            'requests_last_minute': self._count_requests_in_period(
+                request_times, current_time, 60.0
+            ),
+            'requests_last_hour': self._count_requests_in_period(
+                request_times, current_time, 3600.0
+            ),
+        }
+
+    @staticmethod
+    def _count_requests_in_period(
+        request_times: tuple, current_time: float, period: float
+    ) -> int:
+        """Count requests in the last N seconds (request_times is sorted ascending)"""
+        return len(request_times) - bisect_left(request_times, current_time - period)
 
     def reset(self):
         """Reset rate limiter state"""
         with self._lock:
             self._request_times.clear()
-            self._last_request_time = 0.0
+            self._last_request_time = float('-inf')
             self._total_requests = 0
             self._total_wait_time = 0.0
             self._rate_limit_hits = 0
@@ -202,11 +239,18 @@ class BrokerRateLimits:
         'min_request_interval': 0.05,  # 50ms
     }
 
-    # Zerodha Kite Connect - 3 requests/second, with burst allowance
+    # Zerodha Kite Connect - 10 requests/second for endpoints without a tighter limit
     ZERODHA = {
-        'requests_per_second': 3,
-        'requests_per_minute': 180,
-        'min_request_interval': 0.33,  # ~333ms
+        'requests_per_second': 10,
+        'min_request_interval': 0.1,  # 100ms
+    }
+
+    # Zerodha Kite Connect per-endpoint limits, applied on top of ZERODHA
+    ZERODHA_ENDPOINTS = {
+        'quote': {'requests_per_second': 1},  # quote, ltp and ohlc
+        'historical_data': {'requests_per_second': 3},
+        'place_order': {'requests_per_second': 10, 'requests_per_minute': 200},
+        'cancel_order': {'requests_per_second': 10},
     }
 
     # Angel One SmartAPI - 10 requests/second, 500/minute
@@ -216,6 +260,17 @@ class BrokerRateLimits:
         'min_request_interval': 0.1,  # 100ms
     }
 
+    # Angel One SmartAPI per-endpoint limits, applied on top of SMARTAPI
+    SMARTAPI_ENDPOINTS = {
+        'placeOrder': {'requests_per_second': 10},
+        'cancelOrder': {'requests_per_second': 10},
+        'orderBook': {'requests_per_second': 1},
+        'rmsLimit': {'requests_per_second': 2},
+        'ltpData': {'requests_per_second': 10},
+        'getMarketData': {'requests_per_second': 10},
+        'getCandleData': {'requests_per_second': 3, 'requests_per_minute': 180},
+    }
+
     # Conservative default for unknown brokers
     DEFAULT = {
         'requests_per_second': 5,
@@ -245,6 +300,31 @@ class BrokerRateLimits:
 
         return RateLimiter(**config)
 
+    @classmethod
+    def get_endpoint_limiter(cls, broker: str) -> 'EndpointRateLimiter':
+        """
+        Get per-endpoint rate limiter for specific broker.
+
+        Endpoints without a specific limit only use the broker-wide limiter.
+
+        :param broker: Broker name ('openalgo', 'zerodha', 'smartapi')
+        :return: Configured EndpointRateLimiter instance
+        """
+        limiter = EndpointRateLimiter(cls.get_limiter(broker))
+
+        broker_lower = broker.lower()
+        if broker_lower in ['zerodha', 'kite', 'kiteconnect']:
+            endpoint_limits = cls.ZERODHA_ENDPOINTS
+        elif broker_lower in ['smartapi', 'smart_api', 'angelone', 'angel']:
+            endpoint_limits = cls.SMARTAPI_ENDPOINTS
+        else:
+            endpoint_limits = {}
+
+        for endpoint, limits in endpoint_limits.items():
+            limiter.add_endpoint_limit(endpoint, **limits)
+
+        return limiter
+
 
 class EndpointRateLimiter:
     """
@@ -290,19 +370,43 @@ class EndpointRateLimiter:
         """
         Wait if rate limit would be exceeded.
 
+        The default and endpoint limits are checked together and a single sleep covers
+        the longer of both waits.
+
         :param endpoint: Endpoint being accessed
         :return: Total wait time in seconds
         """
-        wait_time = 0.0
+        endpoint_limiter = None
+        if endpoint:
+            with self._lock:
+                endpoint_limiter = self._endpoint_limiters.get(endpoint)
 
         # Always apply default limit
-        wait_time += self._default_limiter.wait_if_needed()
+        if endpoint_limiter is None:
+            return self._default_limiter.wait_if_needed()
+
+        default_limiter = self._default_limiter
+        # Acquire both locks in a fixed order to avoid deadlocks
+        first, second = sorted((default_limiter, endpoint_limiter), key=id)
+        with first._lock, second._lock:
+            current_time = time.monotonic()
+            default_wait = default_limiter._compute_wait_unlocked(current_time)
+            endpoint_wait = endpoint_limiter._compute_wait_unlocked(current_time)
+            wait_time = max(default_wait, endpoint_wait)
 
-        # Apply endpoint-specific limit if exists
-        if endpoint:
-            with self._lock:
-                if endpoint in self._endpoint_limiters:
-                    wait_time += self._endpoint_limiters[endpoint].wait_if_needed()
+            if wait_time > 0:
+                if default_wait > 0:
+                    default_limiter._note_wait_unlocked(default_wait)
+                if endpoint_wait > 0:
+                    endpoint_limiter._note_wait_unlocked(endpoint_wait)
+                logger.debug(
+                    f"Rate limit: waiting {wait_time:.3f}s before request to '{endpoint}'"
+                )
+                time.sleep(wait_time)
+                current_time = time.monotonic()
+
+            default_limiter._record_unlocked(current_time)
+            endpoint_limiter._record_unlocked(current_time)
 
         return wait_time
 
@@ -1,10 +1,21 @@
 """Smart API (Angel One) exchange subclass - for NSE trading"""
 
 import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
+from pathlib import Path
 from typing import Any, List, Optional
 
-from pandas import DataFrame, to_datetime
+import orjson
+import requests
+from cachetools import TTLCache
+from pandas import DataFrame, read_parquet, to_datetime
 
 from freqtrade.constants import BuySell
 from freqtrade.enums import CandleType, InstrumentType, MarginMode, TradingMode
@@ -18,13 +29,63 @@ from freqtrade.exceptions import (
 )
 from freqtrade.exchange.custom_exchange import CustomExchange
 from freqtrade.exchange.exchange_types import FtHas, OrderBook, Ticker
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_minutes
 from freqtrade.exchange.rate_limiter import BrokerRateLimits
 from freqtrade.exchange.lot_size_manager import LotSizeManager
-from freqtrade.exchange.nse_calendar import get_nse_calendar
+from freqtrade.exchange.nse_calendar import NSECalendar, get_nse_calendar
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of tokens per exchange in a single getMarketData request
+MARKET_DATA_TOKEN_LIMIT = 50
+
+# Angel One instrument master (symbol -> token), refreshed daily
+SCRIP_MASTER_URL = (
+    "https://margincalculator.angelbroking.com/OpenAPI_File/files/OpenAPI_ScripMaster.json"
+)
+SCRIP_MASTER_MAX_AGE = 24 * 3600  # seconds
+
+# Keep-alive connection pool for the SmartConnect session (sized for the worker pools below)
+SMARTAPI_HTTP_POOL = {'pool_connections': 10, 'pool_maxsize': 20}
+
+# Concurrent getCandleData requests when a history range spans several windows
+OHLCV_FETCH_WORKERS = 4
+
+# Concurrent placeOrder requests in create_orders
+ORDER_PLACEMENT_WORKERS = 5
+
+# Renew the session JWT before Angel One expires it (tokens are valid for ~24h)
+SESSION_RENEWAL_INTERVAL = 23 * 3600  # seconds
+
+# Options symbol parts, e.g. NIFTY 25DEC24 24500 CE
+_STRIKE_RE = re.compile(r'(\d+)$')
+_EXPIRY_RE = re.compile(r'(\d{1,2}[A-Z]{3}\d{2,4}|\d{4}[A-Z]{3}\d{1,2})$')
+
+# Freqtrade timeframe -> Smart API candle interval
+_INTERVAL_MAP = {
+    '1m': 'ONE_MINUTE',
+    '3m': 'THREE_MINUTE',
+    '5m': 'FIVE_MINUTE',
+    '10m': 'TEN_MINUTE',
+    '15m': 'FIFTEEN_MINUTE',
+    '30m': 'THIRTY_MINUTE',
+    '1h': 'ONE_HOUR',
+    '1d': 'ONE_DAY',
+}
+
+# Smart API order status -> ccxt order status
+_STATUS_MAP = {
+    'complete': 'closed',
+    'rejected': 'canceled',
+    'cancelled': 'canceled',
+    'open': 'open',
+    'pending': 'open',
+}
+
+# Market depth level -> (price, amount)
+_DEPTH_LEVEL = itemgetter('price', 'quantity')
+
 
 class Smartapi(CustomExchange):
     """
@@ -51,9 +112,9 @@ class Smartapi(CustomExchange):
         "always_require_api_keys": True,
     }
 
-    # NSE Market Hours (IST)
-    NSE_MARKET_OPEN = "09:15"
-    NSE_MARKET_CLOSE = "15:30"
+    # NSE Market Hours (IST), shared with the calendar so they are never re-parsed
+    NSE_MARKET_OPEN = NSECalendar.MARKET_OPEN_TIME
+    NSE_MARKET_CLOSE = NSECalendar.MARKET_CLOSE_TIME
     
     # Supported trading modes
     _supported_trading_mode_margin_pairs = [
@@ -89,18 +150,43 @@ class Smartapi(CustomExchange):
         self._username = exchange_config.get('username', '')
         self._password = exchange_config.get('password', exchange_config.get('secret', ''))
         self._totp_token = exchange_config.get('totp_token', '')
+        self._totp = pyotp.TOTP(self._totp_token)
         
-        # Initialize Smart API
-        self._smart_api = SmartConnect(api_key=self._api_key)
+        # Initialize Smart API. Without a pool, SmartConnect issues every request through
+        # the bare requests module and opens a new TLS connection each time.
+        self._smart_api = SmartConnect(api_key=self._api_key, pool=SMARTAPI_HTTP_POOL)
         self._auth_token = None
         self._refresh_token = None
         self._feed_token = None
+        self._renewal_timer: threading.Timer | None = None
         
         # Default exchange
         self._default_exchange = exchange_config.get('nse_exchange', 'NSE')
 
-        # Initialize rate limiter
-        self._rate_limiter = BrokerRateLimits.get_limiter('smartapi')
+        # Symbol token master, loaded lazily from the on-disk scrip master cache
+        self._symbol_token_map: dict[str, str] | None = None
+        self._scrip_master_lock = threading.Lock()
+        self._scrip_master_path = (
+            Path(config.get('user_data_dir', 'user_data')) / 'smartapi_scripmaster.parquet'
+        )
+
+        # Resolved pair -> (trading_symbol, symbol_token, exchange) conversions
+        self._pair_conversion_cache: dict[str, tuple[str, str, str]] = {}
+
+        # Initialize rate limiter, with Angel One's per-endpoint limits
+        self._rate_limiter = BrokerRateLimits.get_endpoint_limiter('smartapi')
+
+        # Batched LTP tickers, keyed by the sorted pair tuple
+        self._fetch_tickers_cache = TTLCache(maxsize=4, ttl=60)
+
+        # Order book indexed by order id, shared by all order lookups of a polling tick
+        self._order_book_cache = TTLCache(maxsize=1, ttl=3)
+
+        # Recent candles per (pair, timeframe, candle_type), extended incrementally
+        self._ohlcv_cache: dict[tuple[str, str, CandleType], list] = {}
+
+        # RMS limits, dropped whenever an order is placed or cancelled
+        self._balance_cache = TTLCache(maxsize=1, ttl=15)
 
         # Initialize lot size manager
         self._lot_size_manager = LotSizeManager()
@@ -122,10 +208,8 @@ class Smartapi(CustomExchange):
     def _login(self):
         """Login to Smart API and get authentication tokens"""
         try:
-            import pyotp
-            
             # Generate TOTP
-            totp = pyotp.TOTP(self._totp_token).now()
+            totp = self._totp.now()
             
             # Generate session
             data = self._smart_api.generateSession(
@@ -146,6 +230,38 @@ class Smartapi(CustomExchange):
             
         except Exception as e:
             raise OperationalException(f"Smart API login failed: {e}")
+        
+        self._schedule_session_renewal()
+
+    def _schedule_session_renewal(self):
+        """(Re-)arm the background timer renewing the session before it expires"""
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
+        self._renewal_timer = threading.Timer(SESSION_RENEWAL_INTERVAL, self._renew_session)
+        self._renewal_timer.daemon = True
+        self._renewal_timer.start()
+
+    def _renew_session(self):
+        """
+        Renew the session JWT using the refresh token.
+        Falls back to a full login (username/password/TOTP) if renewal fails.
+        """
+        try:
+            data = self._smart_api.generateToken(self._refresh_token)
+            if not data.get('status', False):
+                raise ExchangeError(f"Token renewal failed: {data}")
+            
+            self._auth_token = data['data']['jwtToken']
+            self._refresh_token = data['data']['refreshToken']
+            self._feed_token = data['data'].get('feedToken', self._feed_token)
+            logger.info("Smart API session renewed")
+            self._schedule_session_renewal()
+        except Exception as e:
+            logger.warning(f"Smart API session renewal failed, logging in again: {e}")
+            try:
+                self._login()
+            except OperationalException as login_error:
+                logger.error(f"Smart API re-login failed: {login_error}")
 
     def _convert_symbol_to_smartapi(self, pair: str) -> tuple[str, str, str]:
         """
@@ -154,17 +270,22 @@ class Smartapi(CustomExchange):
         :param pair: Freqtrade pair (e.g., 'SBIN/INR')
         :return: Tuple of (trading_symbol, symbol_token, exchange)
         """
+        converted = self._pair_conversion_cache.get(pair)
+        if converted is not None:
+            return converted
+
         # Remove quote currency
-        symbol = pair.split('/')[0]
+        symbol = pair.partition('/')[0]
         
         # Determine exchange
-        if 'NFO' in pair.upper():
+        pair_upper = pair.upper()
+        if 'NFO' in pair_upper:
             exchange = 'NFO'
-            trading_symbol = f"{symbol}"
-        elif 'BSE' in pair.upper():
+            trading_symbol = symbol
+        elif 'BSE' in pair_upper:
             exchange = 'BSE'
             trading_symbol = f"{symbol}-EQ"
-        elif 'MCX' in pair.upper():
+        elif 'MCX' in pair_upper:
             exchange = 'MCX'
             trading_symbol = symbol
         else:
@@ -174,24 +295,96 @@ class Smartapi(CustomExchange):
         # Note: Symbol token would need to be fetched from Smart API master data
         # For now, we'll use a placeholder. In production, implement token lookup.
         symbol_token = self._get_symbol_token(trading_symbol, exchange)
-            
-        return trading_symbol, symbol_token, exchange
+
+        converted = (trading_symbol, symbol_token, exchange)
+        # Unknown tokens are retried once the scrip master is (re)loaded
+        if symbol_token != "0":
+            self._pair_conversion_cache[pair] = converted
+        return converted
 
     def _get_symbol_token(self, trading_symbol: str, exchange: str) -> str:
         """
-        Get symbol token for a trading symbol.
+        Get symbol token for a trading symbol from Smart API's scrip master.
         
-        In production, this should fetch from Smart API's master symbol data.
-        For now, returns a placeholder.
+        :param trading_symbol: Smart API trading symbol (e.g., 'SBIN-EQ')
+        :param exchange: Exchange segment (NSE, BSE, NFO, MCX)
+        :return: Symbol token ("0" if unknown)
         """
-        # TODO: Implement symbol token lookup from Smart API master data
-        # This would typically involve:
-        # 1. Download master symbols file
-        # 2. Search for symbol
-        # 3. Return token
+        token_map = self._symbol_token_map
+        if token_map is None:
+            token_map = self._load_symbol_token_map()
         
-        logger.warning(f"Symbol token lookup not fully implemented for {trading_symbol}")
-        return "0"  # Placeholder
+        token = token_map.get(f"{exchange}|{trading_symbol}")
+        if token is None:
+            logger.warning(f"Symbol token not found for {trading_symbol} on {exchange}")
+            return "0"
+        return token
+
+    def _load_symbol_token_map(self) -> dict[str, str]:
+        """
+        Load the symbol token map from the on-disk scrip master cache.
+        
+        Downloads the scrip master if no cache exists. A cache older than
+        SCRIP_MASTER_MAX_AGE is used as-is and refreshed in a background thread.
+        """
+        with self._scrip_master_lock:
+            if self._symbol_token_map is not None:
+                return self._symbol_token_map
+            
+            try:
+                try:
+                    age = time.time() - self._scrip_master_path.stat().st_mtime
+                except FileNotFoundError:
+                    scrip_master = self._download_scrip_master()
+                else:
+                    scrip_master = read_parquet(self._scrip_master_path)
+                    if age > SCRIP_MASTER_MAX_AGE:
+                        threading.Thread(
+                            target=self._refresh_scrip_master,
+                            name='smartapi-scripmaster',
+                            daemon=True,
+                        ).start()
+                self._symbol_token_map = self._build_symbol_token_map(scrip_master)
+                logger.info(f"Loaded {len(self._symbol_token_map)} Smart API symbol tokens")
+            except Exception as e:
+                logger.error(f"Failed to load Smart API scrip master: {e}")
+                self._symbol_token_map = {}
+            
+            return self._symbol_token_map
+
+    def _download_scrip_master(self) -> DataFrame:
+        """Download the scrip master and persist the columns we need to disk"""
+        logger.info("Downloading Smart API scrip master...")
+        response = requests.get(SCRIP_MASTER_URL, timeout=120)
+        response.raise_for_status()
+        
+        # The scrip master is a JSON array of well over 100k instruments
+        scrip_master = DataFrame(
+            orjson.loads(response.content), columns=['token', 'symbol', 'exch_seg']
+        )
+        
+        # Write to a temporary file first so readers never see a partial cache
+        self._scrip_master_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._scrip_master_path.with_suffix('.tmp')
+        scrip_master.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self._scrip_master_path)
+        
+        return scrip_master
+
+    def _refresh_scrip_master(self):
+        """Refresh a stale scrip master cache (runs in a background thread)"""
+        try:
+            self._symbol_token_map = self._build_symbol_token_map(self._download_scrip_master())
+            self._pair_conversion_cache.clear()
+            logger.info("Smart API scrip master refreshed")
+        except Exception as e:
+            logger.warning(f"Failed to refresh Smart API scrip master: {e}")
+
+    @staticmethod
+    def _build_symbol_token_map(scrip_master: DataFrame) -> dict[str, str]:
+        """Build the '<exchange>|<trading_symbol>' -> token lookup"""
+        keys = scrip_master['exch_seg'].astype(str) + '|' + scrip_master['symbol'].astype(str)
+        return dict(zip(keys, scrip_master['token'].astype(str)))
 
     def parse_options_symbol(self, symbol: str) -> dict:
         """
@@ -209,8 +402,7 @@ class Smartapi(CustomExchange):
             base_symbol = symbol[:-2]  # Remove CE/PE
             
             # Extract strike price (last numeric part)
-            import re
-            strike_match = re.search(r'(\d+)$', base_symbol)
+            strike_match = _STRIKE_RE.search(base_symbol)
             if not strike_match:
                 return {}
             
@@ -218,7 +410,7 @@ class Smartapi(CustomExchange):
             symbol_without_strike = base_symbol[:strike_match.start()]
             
             # Extract expiry date (format varies, e.g., 25DEC24, 2024DEC25)
-            expiry_match = re.search(r'(\d{1,2}[A-Z]{3}\d{2,4}|\d{4}[A-Z]{3}\d{1,2})$', symbol_without_strike)
+            expiry_match = _EXPIRY_RE.search(symbol_without_strike)
             if expiry_match:
                 expiry_str = expiry_match.group(1)
                 underlying = symbol_without_strike[:expiry_match.start()]
@@ -309,20 +501,138 @@ class Smartapi(CustomExchange):
             
             data = response.get('data', {})
             
-            return {
-                'symbol': pair,
-                'ask': None,  # Smart API LTP doesn't provide ask/bid
-                'bid': None,
-                'last': data.get('ltp'),
-                'askVolume': None,
-                'bidVolume': None,
-                'quoteVolume': None,
-                'baseVolume': None,
-                'percentage': None,
-            }
+            return self._ltp_ticker(pair, data.get('ltp'))
         except Exception as e:
             raise ExchangeError(f"Failed to fetch ticker for {pair}: {e}")
 
+    @staticmethod
+    def _ltp_ticker(pair: str, ltp: float | None) -> Ticker:
+        """Build a ticker from a last traded price"""
+        return {
+            'symbol': pair,
+            'ask': None,  # Smart API LTP doesn't provide ask/bid
+            'bid': None,
+            'last': ltp,
+            'askVolume': None,
+            'bidVolume': None,
+            'quoteVolume': None,
+            'baseVolume': None,
+            'percentage': None,
+        }
+
+    def fetch_tickers(self, symbols: list[str] | None = None) -> dict:
+        """
+        Fetch tickers for multiple pairs.
+
+        Tokens are grouped by exchange and fetched with one getMarketData (LTP mode)
+        request per exchange and MARKET_DATA_TOKEN_LIMIT tokens.
+
+        :param symbols: List of pairs to fetch (None for all markets)
+        :return: Dictionary of pair -> ticker
+        """
+        pairs = symbols if symbols else list(self._markets.keys())
+
+        tickers = {}
+        try:
+            for pairs_for_token, data in self._iter_market_data("LTP", pairs):
+                for pair in pairs_for_token:
+                    tickers[pair] = self._ltp_ticker(pair, data.get('ltp'))
+        except Exception as e:
+            raise ExchangeError(f"Failed to fetch tickers: {e}")
+
+        return tickers
+
+    def get_tickers(self, symbols: list[str] | None = None, *, cached: bool = False) -> dict:
+        """
+        Get tickers through fetch_tickers.
+
+        Every fetch refreshes the ticker cache, which is only read when cached is set.
+
+        :param symbols: List of pairs to fetch (None for all markets)
+        :param cached: Allow a cached result
+        :return: Dictionary of pair -> ticker
+        """
+        cache_key = tuple(sorted(symbols if symbols else self._markets.keys()))
+        if cached:
+            with self._cache_lock:
+                tickers = self._fetch_tickers_cache.get(cache_key)
+            if tickers is not None:
+                return tickers
+
+        tickers = self.fetch_tickers(symbols)
+        with self._cache_lock:
+            self._fetch_tickers_cache[cache_key] = tickers
+        return tickers
+
+    def _iter_market_data(
+        self, mode: str, pairs: list[str]
+    ) -> Iterator[tuple[list[str], dict]]:
+        """
+        Fetch getMarketData entries for many pairs with as few requests as possible.
+
+        Tokens are grouped by exchange and requested MARKET_DATA_TOKEN_LIMIT at a time.
+
+        :param mode: getMarketData mode ('LTP', 'OHLC' or 'FULL')
+        :param pairs: Freqtrade pairs
+        :return: Iterator of (pairs sharing the entry's token, fetched entry)
+        """
+        # exchange -> symbol token -> pairs
+        tokens_by_exchange: dict[str, dict[str, list[str]]] = {}
+        for pair in pairs:
+            _, symbol_token, exchange = self._convert_symbol_to_smartapi(pair)
+            tokens_by_exchange.setdefault(exchange, {}).setdefault(symbol_token, []).append(pair)
+
+        for exchange, token_pairs in tokens_by_exchange.items():
+            tokens = list(token_pairs)
+            for start in range(0, len(tokens), MARKET_DATA_TOKEN_LIMIT):
+                # Apply rate limiting
+                self._rate_limit('getMarketData')
+
+                response = self._smart_api.getMarketData(
+                    mode=mode,
+                    exchangeTokens={exchange: tokens[start:start + MARKET_DATA_TOKEN_LIMIT]}
+                )
+
+                if not response.get('status', False):
+                    raise ExchangeError(f"Failed to fetch market data: {response}")
+
+                for data in response.get('data', {}).get('fetched', []):
+                    yield token_pairs.get(str(data.get('symbolToken')), []), data
+
+    @staticmethod
+    def _depth_order_book(pair: str, data: dict, limit: int) -> OrderBook:
+        """Build an order book from a FULL mode market data entry"""
+        depth = data.get('depth', {})
+        return {
+            'symbol': pair,
+            'bids': list(map(_DEPTH_LEVEL, depth.get('buy', [])[:limit])),
+            'asks': list(map(_DEPTH_LEVEL, depth.get('sell', [])[:limit])),
+            'timestamp': None,
+            'datetime': None,
+            'nonce': None,
+        }
+
+    def fetch_order_books(self, pairs: list[str], limit: int = 5) -> dict[str, OrderBook]:
+        """
+        Fetch order books (market depth) for multiple pairs.
+
+        Uses one getMarketData (FULL mode) request per exchange and
+        MARKET_DATA_TOKEN_LIMIT tokens.
+
+        :param pairs: Freqtrade pairs
+        :param limit: Depth limit
+        :return: Dictionary of pair -> order book
+        """
+        order_books = {}
+        try:
+            for pairs_for_token, data in self._iter_market_data("FULL", pairs):
+                for pair in pairs_for_token:
+                    order_books[pair] = self._depth_order_book(pair, data, limit)
+        except Exception as e:
+            raise ExchangeError(f"Failed to fetch order books: {e}")
+
+        return order_books
+
     def fetch_order_book(self, pair: str, limit: int = 5) -> OrderBook:
         """
         Fetch order book (market depth) for a pair.
@@ -331,36 +641,10 @@ class Smartapi(CustomExchange):
         :param limit: Depth limit
         :return: Order book data
         """
-        trading_symbol, symbol_token, exchange = self._convert_symbol_to_smartapi(pair)
-
-        try:
-            # Apply rate limiting
-            self._rate_limit('getMarketData')
-
-            response = self._smart_api.getMarketData(
-                mode="FULL",
-                exchangeTokens={exchange: [symbol_token]}
-            )
-            
-            if not response.get('status', False):
-                raise ExchangeError(f"Failed to fetch order book: {response}")
-            
-            data = response.get('data', {}).get('fetched', [{}])[0]
-            
-            # Extract depth data
-            asks = [(d['price'], d['quantity']) for d in data.get('depth', {}).get('sell', [])[:limit]]
-            bids = [(d['price'], d['quantity']) for d in data.get('depth', {}).get('buy', [])[:limit]]
-            
-            return {
-                'symbol': pair,
-                'bids': bids,
-                'asks': asks,
-                'timestamp': None,
-                'datetime': None,
-                'nonce': None,
-            }
-        except Exception as e:
-            raise ExchangeError(f"Failed to fetch order book for {pair}: {e}")
+        order_book = self.fetch_order_books([pair], limit).get(pair)
+        if order_book is None:
+            order_book = self._depth_order_book(pair, {}, limit)
+        return order_book
 
     def fetch_ohlcv(
         self,
@@ -383,68 +667,131 @@ class Smartapi(CustomExchange):
         trading_symbol, symbol_token, exchange = self._convert_symbol_to_smartapi(pair)
         
         # Convert Freqtrade timeframe to Smart API interval
-        interval_map = {
-            '1m': 'ONE_MINUTE',
-            '3m': 'THREE_MINUTE',
-            '5m': 'FIVE_MINUTE',
-            '10m': 'TEN_MINUTE',
-            '15m': 'FIFTEEN_MINUTE',
-            '30m': 'THIRTY_MINUTE',
-            '1h': 'ONE_HOUR',
-            '1d': 'ONE_DAY',
-        }
+        interval = _INTERVAL_MAP.get(timeframe, 'FIVE_MINUTE')
         
-        interval = interval_map.get(timeframe, 'FIVE_MINUTE')
+        # Without an explicit start, only the candles after the cached ones are requested.
+        # The last cached candle is fetched again as it may still have been in progress.
+        cache_key = (pair, timeframe, candle_type)
+        cached = self._ohlcv_cache.get(cache_key) if not since else None
         
         # Calculate date range
         if since:
             from_date = datetime.fromtimestamp(since / 1000)
+        elif cached:
+            from_date = datetime.fromtimestamp(cached[-1][0] / 1000)
         else:
             from_date = datetime.now() - timedelta(days=7)
             
         to_date = datetime.now()
 
+        # Split the range into windows of at most ohlcv_candle_limit candles each
+        candle_minutes = timeframe_to_minutes(timeframe if timeframe in _INTERVAL_MAP else '5m')
+        window = timedelta(minutes=candle_minutes * self._ft_has['ohlcv_candle_limit'])
+        windows = []
+        window_start = from_date
+        while window_start < to_date:
+            window_end = min(window_start + window, to_date)
+            windows.append((window_start, window_end))
+            window_start = window_end
+
         try:
-            # Apply rate limiting
-            self._rate_limit('getCandleData')
-
-            params = {
-                "exchange": exchange,
-                "symboltoken": symbol_token,
-                "interval": interval,
-                "fromdate": from_date.strftime("%Y-%m-%d %H:%M"),
-                "todate": to_date.strftime("%Y-%m-%d %H:%M")
-            }
-            
-            response = self._smart_api.getCandleData(params)
+            if len(windows) > 1:
+                # Windows are independent, so fetch them concurrently. The shared
+                # rate limiter still spaces the individual requests.
+                with ThreadPoolExecutor(
+                    max_workers=min(OHLCV_FETCH_WORKERS, len(windows))
+                ) as executor:
+                    chunks = list(executor.map(
+                        lambda w: self._fetch_ohlcv_chunk(
+                            exchange, symbol_token, interval, w[0], w[1]),
+                        windows
+                    ))
+                # Adjacent windows share their boundary candle - keep one of each
+                data = list({candle[0]: candle for chunk in chunks for candle in chunk}.values())
+            else:
+                data = self._fetch_ohlcv_chunk(
+                    exchange, symbol_token, interval, from_date, to_date)
             
-            if not response.get('status', False):
-                raise ExchangeError(f"Failed to fetch OHLCV: {response}")
-            
-            data = response.get('data', [])
-            
-            # Convert to OHLCV format: [timestamp, open, high, low, close, volume]
-            ohlcv = []
-            for candle in data:
-                timestamp = int(to_datetime(candle[0]).timestamp() * 1000)
-                ohlcv.append([
-                    timestamp,
-                    float(candle[1]),  # open
-                    float(candle[2]),  # high
-                    float(candle[3]),  # low
-                    float(candle[4]),  # close
-                    float(candle[5]) if len(candle) > 5 else 0  # volume
-                ])
-            
-            # Apply limit
-            if limit:
-                ohlcv = ohlcv[-limit:]
-                
-            return ohlcv
+            ohlcv = self._convert_candles(data)
             
         except Exception as e:
             raise ExchangeError(f"Failed to fetch OHLCV for {pair}: {e}")
 
+        if not since:
+            if cached:
+                # Replace the re-fetched tail of the cache with the fresh candles
+                if ohlcv:
+                    ohlcv = [c for c in cached if c[0] < ohlcv[0][0]] + ohlcv
+                else:
+                    ohlcv = cached
+            # Keep the same 7 day window an uncached request returns
+            cutoff = int((to_date - timedelta(days=7)).timestamp() * 1000)
+            ohlcv = [c for c in ohlcv if c[0] >= cutoff]
+            self._ohlcv_cache[cache_key] = ohlcv
+
+        # Apply limit
+        if limit:
+            ohlcv = ohlcv[-limit:]
+        return ohlcv
+
+    @staticmethod
+    def _convert_candles(data: list) -> list:
+        """
+        Convert raw Smart API candles to OHLCV format.
+        
+        :param data: Smart API candles ([timestamp, open, high, low, close, volume])
+        :return: List of [timestamp_ms, open, high, low, close, volume]
+        """
+        if not data:
+            return []
+        
+        candles = DataFrame(data)
+        timestamps = to_datetime(candles[0], utc=True).dt.as_unit('ms').astype('int64')
+        if candles.shape[1] < 6:
+            candles[5] = 0.0  # volume
+        values = candles[[1, 2, 3, 4, 5]].astype('float64').fillna(0.0)
+        
+        return [
+            [timestamp, *row]
+            for timestamp, row in zip(timestamps.tolist(), values.to_numpy().tolist())
+        ]
+
+    def _fetch_ohlcv_chunk(
+        self,
+        exchange: str,
+        symbol_token: str,
+        interval: str,
+        from_date: datetime,
+        to_date: datetime,
+    ) -> list:
+        """
+        Fetch raw Smart API candles for a single date window.
+        
+        :param exchange: Smart API exchange segment
+        :param symbol_token: Smart API symbol token
+        :param interval: Smart API candle interval
+        :param from_date: Window start
+        :param to_date: Window end
+        :return: List of raw candles
+        """
+        # Apply rate limiting
+        self._rate_limit('getCandleData')
+
+        params = {
+            "exchange": exchange,
+            "symboltoken": symbol_token,
+            "interval": interval,
+            "fromdate": from_date.strftime("%Y-%m-%d %H:%M"),
+            "todate": to_date.strftime("%Y-%m-%d %H:%M")
+        }
+        
+        response = self._smart_api.getCandleData(params)
+        
+        if not response.get('status', False):
+            raise ExchangeError(f"Failed to fetch OHLCV: {response}")
+        
+        return response.get('data') or []
+
     def create_order(
         self,
         pair: str,
@@ -503,10 +850,11 @@ class Smartapi(CustomExchange):
             "ordertype": order_type,
             "producttype": product_type,
             "duration": "DAY",
-            "price": str(rate) if rate else "0",
+            # Prices are sent with paise precision, matching the exchange tick size
+            "price": f"{rate:.2f}" if rate else "0",
             "squareoff": "0",
             "stoploss": "0",
-            "quantity": str(int(amount))
+            "quantity": f"{int(amount)}"
         }
 
         try:
@@ -514,6 +862,7 @@ class Smartapi(CustomExchange):
             self._rate_limit('placeOrder')
 
             order_id = self._smart_api.placeOrder(order_params)
+            self._invalidate_order_caches()
             
             return {
                 'id': order_id,
@@ -536,6 +885,35 @@ class Smartapi(CustomExchange):
                 raise InsufficientFundsError(f"Insufficient funds: {e}")
             raise ExchangeError(f"Failed to create order: {e}")
 
+    def create_orders(self, orders: list[dict]) -> list[dict | Exception]:
+        """
+        Create several orders at once.
+
+        Smart API accepts one order per placeOrder request, so the requests are sent
+        concurrently (up to ORDER_PLACEMENT_WORKERS at a time) instead of one after
+        another. The placeOrder rate limit still applies to each of them.
+        A failed order does not hide the others - every order gets its own result, so
+        the orders that were placed can still be tracked.
+
+        :param orders: List of create_order keyword arguments, one dict per order
+        :return: Order data, or the exception raised for that order, in the same order
+                 as the given orders
+        """
+        def place(order: dict) -> dict | Exception:
+            try:
+                return self.create_order(**order)
+            except Exception as e:
+                logger.warning(f"Failed to create order for {order.get('pair')}: {e}")
+                return e
+
+        if len(orders) <= 1:
+            return [place(order) for order in orders]
+
+        with ThreadPoolExecutor(
+            max_workers=min(ORDER_PLACEMENT_WORKERS, len(orders))
+        ) as executor:
+            return list(executor.map(place, orders))
+
     def fetch_order(self, order_id: str, pair: str, params: dict | None = None) -> dict:
         """
         Fetch order status.
@@ -546,36 +924,12 @@ class Smartapi(CustomExchange):
         :return: Order data
         """
         try:
-            # Apply rate limiting
-            self._rate_limit('orderBook')
-
-            response = self._smart_api.orderBook()
-            
-            if not response.get('status', False):
-                raise ExchangeError(f"Failed to fetch order book: {response}")
-            
-            orders = response.get('data', [])
-            
-            # Find the specific order
-            order = None
-            for o in orders:
-                if o.get('orderid') == order_id:
-                    order = o
-                    break
+            order = self._get_order_index().get(order_id)
             
             if not order:
                 raise InvalidOrderException(f"Order {order_id} not found")
             
-            # Map status
-            status_map = {
-                'complete': 'closed',
-                'rejected': 'canceled',
-                'cancelled': 'canceled',
-                'open': 'open',
-                'pending': 'open',
-            }
-            
-            status = status_map.get(order.get('status', '').lower(), 'open')
+            status = _STATUS_MAP.get(order.get('status', '').lower(), 'open')
             
             return {
                 'id': order_id,
@@ -614,6 +968,7 @@ class Smartapi(CustomExchange):
                 order_id=order_id,
                 variety="NORMAL"
             )
+            self._invalidate_order_caches()
             
             return {
                 'id': order_id,
@@ -624,6 +979,45 @@ class Smartapi(CustomExchange):
         except Exception as e:
             raise ExchangeError(f"Failed to cancel order {order_id}: {e}")
 
+    def _invalidate_order_caches(self) -> None:
+        """
+        Drop the cached order book and balance after an order was placed or cancelled.
+        
+        Orders may be placed from several threads at once (create_orders), so the
+        caches are only touched under the cache lock.
+        """
+        with self._cache_lock:
+            self._order_book_cache.clear()
+            self._balance_cache.clear()
+
+    def _get_order_index(self) -> dict[str, dict]:
+        """
+        Get the account order book indexed by order id.
+        
+        The result is cached for a few seconds so that repeated order lookups
+        within one polling tick share a single orderBook() request.
+        
+        :return: Dict of order id -> Smart API order
+        """
+        with self._cache_lock:
+            order_index = self._order_book_cache.get('orders')
+        if order_index is not None:
+            return order_index
+        
+        # Fetch without holding the lock - the rate limiter may sleep and other cache
+        # users must not wait for it
+        self._rate_limit('orderBook')
+        
+        response = self._smart_api.orderBook()
+        
+        if not response.get('status', False):
+            raise ExchangeError(f"Failed to fetch order book: {response}")
+        
+        order_index = {o.get('orderid'): o for o in response.get('data') or []}
+        with self._cache_lock:
+            self._order_book_cache['orders'] = order_index
+        return order_index
+
     def fetch_orders(self, pair: str, since: Optional[int] = None) -> List[dict]:
         """
         Fetch all orders for a pair.
@@ -633,16 +1027,7 @@ class Smartapi(CustomExchange):
         :return: List of orders
         """
         try:
-            # Apply rate limiting
-            self._rate_limit('orderBook')
-
-            response = self._smart_api.orderBook()
-
-            if not response.get('status', False):
-                logger.warning(f"Failed to fetch orders: {response}")
-                return []
-
-            orders = response.get('data', [])
+            orders = self._get_order_index().values()
             result = []
 
             for order in orders:
@@ -691,6 +1076,11 @@ class Smartapi(CustomExchange):
         
         :return: Balance data
         """
+        with self._cache_lock:
+            balance = self._balance_cache.get('balance')
+        if balance is not None:
+            return balance
+
         try:
             # Apply rate limiting
             self._rate_limit('rmsLimit')
@@ -706,17 +1096,21 @@ class Smartapi(CustomExchange):
             available_cash = float(data.get('availablecash', 0))
             used_margin = float(data.get('m2munrealized', 0))
             
+            total = available_cash + used_margin
+            
             balance = {
                 'INR': {
                     'free': available_cash,
                     'used': used_margin,
-                    'total': available_cash + used_margin,
+                    'total': total,
                 },
                 'info': data,
                 'free': {'INR': available_cash},
                 'used': {'INR': used_margin},
-                'total': {'INR': available_cash + used_margin},
+                'total': {'INR': total},
             }
+            with self._cache_lock:
+                self._balance_cache['balance'] = balance
             
             return balance
             
@@ -773,7 +1167,7 @@ class Smartapi(CustomExchange):
         supported = {
             'fetchOHLCV': True,
             'fetchTicker': True,
-            'fetchTickers': False,
+            'fetchTickers': True,
             'fetchOrderBook': True,
             'createOrder': True,
             'cancelOrder': True,
@@ -807,8 +1201,10 @@ class Smartapi(CustomExchange):
     
     def close(self) -> None:
         """Close exchange connections"""
-        # Smart API handles cleanup internally
-        pass
+        # Smart API handles connection cleanup internally
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
+            self._renewal_timer = None
     
     def reload_markets(self, reload: bool = False) -> None:
         """Reload markets (no-op for Smart API as markets are static)"""
@@ -12,14 +12,59 @@ Features:
 - Token lookup for brokers that require it
 """
 
-import json
 import logging
-import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from string import digits
+from typing import Callable, Dict, Optional, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Broker names, interned so dict lookups and comparisons can match on identity
+BROKER_OPENALGO = sys.intern('openalgo')
+BROKER_SMARTAPI = sys.intern('smartapi')
+BROKER_PAPER = sys.intern('paperbroker')
+
+@lru_cache(maxsize=4096)
+def _parse_options_symbol(symbol: str) -> Optional[Dict]:
+    """
+    Parse options symbol to extract components.
+    
+    Results are memoized, so the returned dict is shared and must not be modified.
+    See SymbolMapper.parse_options_symbol.
+    """
+    if not symbol.endswith(('CE', 'PE')):
+        return None
+    
+    try:
+        # Extract option type
+        option_type = 'CALL' if symbol.endswith('CE') else 'PUT'
+        base_symbol = symbol[:-2]
+        
+        # Extract strike price (last numeric part) by stripping trailing digits
+        symbol_without_strike = base_symbol.rstrip(digits)
+        if len(symbol_without_strike) == len(base_symbol):
+            return None
+        
+        strike_price = float(base_symbol[len(symbol_without_strike):])
+        
+        # The strike takes all trailing digits, so the remainder never ends in an expiry
+        # date and is reported as the underlying, with no expiry
+        return {
+            'underlying': symbol_without_strike,
+            'strike': strike_price,
+            'option_type': option_type,
+            'expiry': None,
+            'original': symbol
+        }
+    
+    except Exception as e:
+        logger.error(f"Error parsing options symbol {symbol}: {e}")
+        return None
+
 
 class SymbolMapper:
     """
@@ -33,27 +78,37 @@ class SymbolMapper:
     - Paper Broker: Same as Freqtrade format
     """
     
+    __slots__ = (
+        'mappings',
+        '_reverse_flat',
+        '_to_broker_cache',
+        '_smartapi_fmt',
+        '_smartapi_equity_fmt',
+        '_formatters',
+        '_default_formatters',
+    )
+    
     # Default symbol mappings (can be overridden by config file)
     DEFAULT_MAPPINGS = {
         "NIFTY50": {
-            "openalgo": {"symbol": "NIFTY 50", "exchange": "NSE"},
-            "smartapi": {"symbol": "NIFTY 50", "token": "99926000", "exchange": "NSE"},
-            "paperbroker": {"symbol": "NIFTY50"},
+            BROKER_OPENALGO: {"symbol": "NIFTY 50", "exchange": "NSE"},
+            BROKER_SMARTAPI: {"symbol": "NIFTY 50", "token": "99926000", "exchange": "NSE"},
+            BROKER_PAPER: {"symbol": "NIFTY50"},
         },
         "BANKNIFTY": {
-            "openalgo": {"symbol": "NIFTY BANK", "exchange": "NSE"},
-            "smartapi": {"symbol": "NIFTY BANK", "token": "99926009", "exchange": "NSE"},
-            "paperbroker": {"symbol": "BANKNIFTY"},
+            BROKER_OPENALGO: {"symbol": "NIFTY BANK", "exchange": "NSE"},
+            BROKER_SMARTAPI: {"symbol": "NIFTY BANK", "token": "99926009", "exchange": "NSE"},
+            BROKER_PAPER: {"symbol": "BANKNIFTY"},
         },
         "FINNIFTY": {
-            "openalgo": {"symbol": "NIFTY FIN SERVICE", "exchange": "NSE"},
-            "smartapi": {"symbol": "NIFTY FIN SERVICE", "token": "99926037", "exchange": "NSE"},
-            "paperbroker": {"symbol": "FINNIFTY"},
+            BROKER_OPENALGO: {"symbol": "NIFTY FIN SERVICE", "exchange": "NSE"},
+            BROKER_SMARTAPI: {"symbol": "NIFTY FIN SERVICE", "token": "99926037", "exchange": "NSE"},
+            BROKER_PAPER: {"symbol": "FINNIFTY"},
         },
         "MIDCPNIFTY": {
-            "openalgo": {"symbol": "NIFTY MID SELECT", "exchange": "NSE"},
-            "smartapi": {"symbol": "NIFTY MID SELECT", "token": "99926074", "exchange": "NSE"},
-            "paperbroker": {"symbol": "MIDCPNIFTY"},
+            BROKER_OPENALGO: {"symbol": "NIFTY MID SELECT", "exchange": "NSE"},
+            BROKER_SMARTAPI: {"symbol": "NIFTY MID SELECT", "token": "99926074", "exchange": "NSE"},
+            BROKER_PAPER: {"symbol": "MIDCPNIFTY"},
         },
     }
     
@@ -65,6 +120,17 @@ class SymbolMapper:
         "MCX": "",     # Commodities
     }
     
+    # Brokers whose symbols are mapped back in from_broker_format
+    REVERSE_BROKERS = frozenset({BROKER_OPENALGO, BROKER_SMARTAPI, BROKER_PAPER})
+    
+    # Distinct non-empty SmartAPI suffixes, stripped in from_broker_format
+    _SMARTAPI_STRIP_SUFFIXES: Tuple[str, ...] = tuple(
+        dict.fromkeys(suffix for suffix in SMARTAPI_SUFFIXES.values() if suffix)
+    )
+    _SMARTAPI_SUFFIX_SLICES: Tuple[Tuple[str, int], ...] = tuple(
+        (suffix, len(suffix)) for suffix in _SMARTAPI_STRIP_SUFFIXES
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize symbol mapper.
@@ -72,42 +138,70 @@ class SymbolMapper:
         :param config_path: Path to custom symbol mapping config file (JSON)
         """
         self.mappings: Dict[str, Dict] = self.DEFAULT_MAPPINGS.copy()
-        self.reverse_mappings: Dict[str, Dict] = {}
+        # (broker, broker_symbol) -> freqtrade symbol, built on first reverse lookup
+        self._reverse_flat: Optional[Dict[Tuple[str, str], str]] = None
+        # (pair, broker, default_exchange) -> to_broker_format result
+        self._to_broker_cache: Dict[Tuple[str, str, str], Tuple] = {}
+        
+        # Exchange -> SmartAPI trading symbol builder (appends the exchange suffix)
+        self._smartapi_fmt: Dict[str, Callable[[str], str]] = {
+            exchange: (lambda symbol, suffix=suffix: symbol + suffix) if suffix else str
+            for exchange, suffix in self.SMARTAPI_SUFFIXES.items()
+        }
+        self._smartapi_equity_fmt = self._smartapi_fmt['NSE']
+        
+        # Broker -> formatter, for pairs with and without a custom mapping
+        self._formatters: Dict[str, Callable] = {
+            BROKER_OPENALGO: self._format_openalgo,
+            BROKER_SMARTAPI: self._format_smartapi,
+            BROKER_PAPER: self._format_paperbroker,
+        }
+        self._default_formatters: Dict[str, Callable] = {
+            BROKER_OPENALGO: self._default_openalgo,
+            BROKER_SMARTAPI: self._default_smartapi,
+            BROKER_PAPER: self._default_paperbroker,
+        }
         
         # Load custom mappings if provided
         if config_path:
             self.load_mappings(config_path)
-        
-        # Build reverse mappings for quick lookup
-        self._build_reverse_mappings()
     
     def load_mappings(self, config_path: str):
         """Load custom symbol mappings from JSON file."""
         try:
-            path = Path(config_path)
-            if path.exists():
-                with open(path, 'r') as f:
-                    custom_mappings = json.load(f)
-                    self.mappings.update(custom_mappings)
-                    logger.info(f"Loaded {len(custom_mappings)} custom symbol mappings from {config_path}")
-            else:
-                logger.warning(f"Symbol mapping file not found: {config_path}")
+            custom_mappings = {
+                symbol: {sys.intern(broker): m for broker, m in brokers.items()}
+                for symbol, brokers in orjson.loads(Path(config_path).read_bytes()).items()
+            }
+        except FileNotFoundError:
+            logger.warning(f"Symbol mapping file not found: {config_path}")
+            return
         except Exception as e:
             logger.error(f"Error loading symbol mappings: {e}")
+            return
+        
+        self.mappings.update(custom_mappings)
+        self._to_broker_cache.clear()
+        self._reverse_flat = None
+        logger.info(f"Loaded {len(custom_mappings)} custom symbol mappings from {config_path}")
+    
+    def _get_reverse_mappings(self) -> Dict[Tuple[str, str], str]:
+        """Get the reverse mappings, building them if the mappings changed in bulk."""
+        if self._reverse_flat is None:
+            self._build_reverse_mappings()
+        return self._reverse_flat
     
     def _build_reverse_mappings(self):
         """Build reverse mappings for broker -> freqtrade conversion."""
-        self.reverse_mappings = {
-            'openalgo': {},
-            'smartapi': {},
-            'paperbroker': {},
-        }
+        reverse_flat = {}
         
         for freqtrade_symbol, broker_mappings in self.mappings.items():
             for broker, mapping in broker_mappings.items():
-                if broker in self.reverse_mappings:
+                if broker in self.REVERSE_BROKERS:
                     key = mapping.get('symbol', freqtrade_symbol)
-                    self.reverse_mappings[broker][key] = freqtrade_symbol
+                    reverse_flat[(broker, key)] = freqtrade_symbol
+        
+        self._reverse_flat = reverse_flat
     
     def to_broker_format(self, pair: str, broker: str, default_exchange: str = "NSE") -> Tuple:
         """
@@ -118,47 +212,73 @@ class SymbolMapper:
         :param default_exchange: Default exchange if not specified
         :return: Tuple with broker-specific format
         """
+        key = (pair, broker, default_exchange)
+        converted = self._to_broker_cache.get(key)
+        if converted is None:
+            converted = self._to_broker_format(pair, broker, default_exchange)
+            self._to_broker_cache[key] = converted
+        return converted
+    
+    def _to_broker_format(self, pair: str, broker: str, default_exchange: str) -> Tuple:
+        """Uncached to_broker_format conversion."""
         # Extract base symbol and quote currency
-        parts = pair.split('/')
-        base_symbol = parts[0]
-        quote_currency = parts[1] if len(parts) > 1 else "INR"
+        base_symbol, sep, quote_currency = pair.partition('/')
+        if not sep:
+            quote_currency = "INR"
         
         # Check if we have a custom mapping
-        if base_symbol in self.mappings and broker in self.mappings[base_symbol]:
-            mapping = self.mappings[base_symbol][broker]
-            
-            if broker == "openalgo":
-                return (
-                    mapping.get('symbol', base_symbol),
-                    mapping.get('exchange', default_exchange)
+        broker_mappings = self.mappings.get(base_symbol)
+        if broker_mappings and broker in broker_mappings:
+            formatter = self._formatters.get(broker)
+            if formatter is not None:
+                return formatter(
+                    broker_mappings[broker], base_symbol, quote_currency, default_exchange
                 )
-            elif broker == "smartapi":
-                return (
-                    mapping.get('symbol', base_symbol),
-                    mapping.get('token', '0'),
-                    mapping.get('exchange', default_exchange)
-                )
-            elif broker == "paperbroker":
-                return (mapping.get('symbol', base_symbol), quote_currency)
         
         # No custom mapping, use default conversion
         return self._default_conversion(base_symbol, quote_currency, broker, default_exchange)
     
+    @staticmethod
+    def _format_openalgo(mapping: Dict, symbol: str, quote: str, exchange: str) -> Tuple:
+        """OpenAlgo format from a custom mapping: (symbol, exchange)."""
+        return (mapping.get('symbol', symbol), mapping.get('exchange', exchange))
+    
+    @staticmethod
+    def _format_smartapi(mapping: Dict, symbol: str, quote: str, exchange: str) -> Tuple:
+        """SmartAPI format from a custom mapping: (trading_symbol, token, exchange)."""
+        return (
+            mapping.get('symbol', symbol),
+            mapping.get('token', '0'),
+            mapping.get('exchange', exchange)
+        )
+    
+    @staticmethod
+    def _format_paperbroker(mapping: Dict, symbol: str, quote: str, exchange: str) -> Tuple:
+        """Paper broker format from a custom mapping: (symbol, quote)."""
+        return (mapping.get('symbol', symbol), quote)
+    
     def _default_conversion(self, symbol: str, quote: str, broker: str, exchange: str) -> Tuple:
         """Default conversion when no custom mapping exists."""
-        if broker == "openalgo":
-            return (symbol, exchange)
-        
-        elif broker == "smartapi":
-            # Add exchange suffix for SmartAPI
-            suffix = self.SMARTAPI_SUFFIXES.get(exchange, "-EQ")
-            trading_symbol = f"{symbol}{suffix}" if suffix else symbol
-            return (trading_symbol, "0", exchange)  # Token needs to be looked up
-        
-        elif broker == "paperbroker":
-            return (symbol, quote)
-        
-        return (symbol,)
+        formatter = self._default_formatters.get(broker)
+        if formatter is None:
+            return (symbol,)
+        return formatter(symbol, quote, exchange)
+    
+    @staticmethod
+    def _default_openalgo(symbol: str, quote: str, exchange: str) -> Tuple:
+        """OpenAlgo format without a custom mapping."""
+        return (symbol, exchange)
+    
+    def _default_smartapi(self, symbol: str, quote: str, exchange: str) -> Tuple:
+        """SmartAPI format without a custom mapping."""
+        # Add exchange suffix for SmartAPI (unknown exchanges are treated as equity)
+        trading_symbol = self._smartapi_fmt.get(exchange, self._smartapi_equity_fmt)(symbol)
+        return (trading_symbol, "0", exchange)  # Token needs to be looked up
+    
+    @staticmethod
+    def _default_paperbroker(symbol: str, quote: str, exchange: str) -> Tuple:
+        """Paper broker format without a custom mapping."""
+        return (symbol, quote)
     
     def from_broker_format(self, broker: str, *args, quote_currency: str = "INR") -> str:
         """
@@ -169,21 +289,21 @@ class SymbolMapper:
         :param quote_currency: Quote currency (default: INR)
         :return: Freqtrade pair format
         """
-        if broker == "openalgo":
+        if broker == BROKER_OPENALGO:
             symbol, exchange = args[0], args[1] if len(args) > 1 else "NSE"
-        elif broker == "smartapi":
+        elif broker == BROKER_SMARTAPI:
             symbol = args[0]
-            # Remove SmartAPI suffix
-            for suffix in self.SMARTAPI_SUFFIXES.values():
-                if suffix and symbol.endswith(suffix):
-                    symbol = symbol[:-len(suffix)]
-                    break
+            # Remove SmartAPI suffix (a single C-level check for the common no-suffix case)
+            if symbol.endswith(self._SMARTAPI_STRIP_SUFFIXES):
+                for suffix, suffix_len in self._SMARTAPI_SUFFIX_SLICES:
+                    if symbol.endswith(suffix):
+                        symbol = symbol[:-suffix_len]
+                        break
         else:
             symbol = args[0]
         
         # Check reverse mapping
-        if broker in self.reverse_mappings and symbol in self.reverse_mappings[broker]:
-            symbol = self.reverse_mappings[broker][symbol]
+        symbol = self._get_reverse_mappings().get((broker, symbol), symbol)
         
         return f"{symbol}/{quote_currency}"
     
@@ -198,46 +318,14 @@ class SymbolMapper:
         :param symbol: Options symbol
         :return: Dict with strike, expiry, option_type, underlying
         """
-        if not symbol.endswith(('CE', 'PE')):
+        # Cheap rejection of equities ending in CE/PE (ACE, ICE, ...): options always
+        # have a strike right before the type. This also keeps them out of the cache.
+        if not symbol.endswith(('CE', 'PE')) or not symbol[-3:-2].isdigit():
             return None
         
-        try:
-            # Extract option type
-            option_type = 'CALL' if symbol.endswith('CE') else 'PUT'
-            base_symbol = symbol[:-2]
-            
-            # Extract strike price (last numeric part)
-            strike_match = re.search(r'(\d+)$', base_symbol)
-            if not strike_match:
-                return None
-            
-            strike_price = float(strike_match.group(1))
-            symbol_without_strike = base_symbol[:strike_match.start()]
-            
-            # Extract expiry date
-            expiry_match = re.search(
-                r'(\d{1,2}[A-Z]{3}\d{2,4}|\d{4}[A-Z]{3}\d{1,2})$',
-                symbol_without_strike
-            )
-            
-            if expiry_match:
-                expiry_str = expiry_match.group(1)
-                underlying = symbol_without_strike[:expiry_match.start()]
-            else:
-                underlying = symbol_without_strike
-                expiry_str = None
-            
-            return {
-                'underlying': underlying,
-                'strike': strike_price,
-                'option_type': option_type,
-                'expiry': expiry_str,
-                'original': symbol
-            }
-        
-        except Exception as e:
-            logger.error(f"Error parsing options symbol {symbol}: {e}")
-            return None
+        parsed = _parse_options_symbol(symbol)
+        # Hand out a copy so callers can't alter the cached result
+        return dict(parsed) if parsed is not None else None
     
     def add_mapping(self, freqtrade_symbol: str, broker: str, mapping: Dict):
         """
@@ -250,8 +338,21 @@ class SymbolMapper:
         if freqtrade_symbol not in self.mappings:
             self.mappings[freqtrade_symbol] = {}
         
-        self.mappings[freqtrade_symbol][broker] = mapping
-        self._build_reverse_mappings()
+        broker_mappings = self.mappings[freqtrade_symbol]
+        
+        # Update the reverse lookup in place rather than rebuilding it.
+        # If it hasn't been built yet, it will pick up the new mapping when it is.
+        reverse_flat = self._reverse_flat
+        if reverse_flat is not None and broker in self.REVERSE_BROKERS:
+            previous = broker_mappings.get(broker)
+            if previous is not None:
+                previous_key = (broker, previous.get('symbol', freqtrade_symbol))
+                if reverse_flat.get(previous_key) == freqtrade_symbol:
+                    del reverse_flat[previous_key]
+            reverse_flat[(broker, mapping.get('symbol', freqtrade_symbol))] = freqtrade_symbol
+        
+        broker_mappings[broker] = mapping
+        self._to_broker_cache.clear()
     
     def save_mappings(self, config_path: str):
         """Save current mappings to JSON file."""
@@ -259,8 +360,7 @@ class SymbolMapper:
             path = Path(config_path)
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(path, 'w') as f:
-                json.dump(self.mappings, f, indent=2)
+            path.write_bytes(orjson.dumps(self.mappings, option=orjson.OPT_INDENT_2))
             
             logger.info(f"Saved symbol mappings to {config_path}")
         except Exception as e:
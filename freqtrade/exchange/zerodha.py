@@ -1,12 +1,20 @@
 """Zerodha exchange subclass - for NSE trading using Kite Connect API"""
 
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import os
+import re
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
-from pandas import DataFrame, to_datetime
+import orjson
+from cachetools import TTLCache
+from pandas import DataFrame, read_parquet, to_datetime
+from urllib3.util.retry import Retry
 
 from freqtrade.constants import BuySell
 from freqtrade.enums import CandleType, MarginMode, TradingMode
@@ -22,11 +30,100 @@ from freqtrade.exchange.custom_exchange import CustomExchange
 from freqtrade.exchange.exchange_types import FtHas, OrderBook, Ticker
 from freqtrade.exchange.rate_limiter import BrokerRateLimits
 from freqtrade.exchange.lot_size_manager import LotSizeManager
-from freqtrade.exchange.nse_calendar import get_nse_calendar
+from freqtrade.exchange.nse_calendar import NSECalendar, get_nse_calendar
 
 
 logger = logging.getLogger(__name__)
 
+# Stored access tokens closer than this to their expiry are not reused
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+
+# Connection pool for the KiteConnect session. Retries only apply to idempotent requests,
+# order placement (POST) is never retried.
+KITE_HTTP_POOL = {
+    'pool_connections': 10,
+    'pool_maxsize': 20,
+    'max_retries': Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+}
+
+# Maximum number of instruments per Kite quote request
+QUOTE_INSTRUMENT_LIMIT = 500
+
+# Concurrent historical_data requests when fetching candles for several pairs
+OHLCV_FETCH_WORKERS = 3
+
+# Concurrent cancel_order requests when cancelling several orders
+ORDER_CANCEL_WORKERS = 5
+
+# KiteTicker ticks older than this (seconds) are refreshed through the quote API
+TICK_MAX_AGE = 5
+
+# Options symbol components (e.g. NIFTY25DEC24500CE)
+_STRIKE_RE = re.compile(r'(\d+)$')
+_EXPIRY_RE = re.compile(r'(\d{1,2}[A-Z]{3}\d{2,4}|\d{4}[A-Z]{3}\d{1,2})$')
+
+
+def _parse_expiry_date(expiry_str: str) -> Optional[datetime]:
+    """Parse expiry date string to datetime"""
+    try:
+        # Handle different formats
+        if len(expiry_str) == 7:  # 25DEC24
+            return datetime.strptime(expiry_str, '%d%b%y')
+        elif len(expiry_str) == 9:  # 2024DEC25
+            return datetime.strptime(expiry_str, '%Y%b%d')
+        else:
+            return None
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_options_symbol(symbol: str) -> Dict[str, Any]:
+    """
+    Parse options symbol to extract components.
+    
+    Results are cached, callers must not modify the returned dict.
+    
+    :param symbol: Options symbol ending in CE/PE (e.g., 'NIFTY25DEC24500CE')
+    :return: Dict with strike, expiry, option_type, underlying (empty if unparseable)
+    """
+    try:
+        # Extract option type (CE/PE)
+        option_type = 'CALL' if symbol.endswith('CE') else 'PUT'
+        base_symbol = symbol[:-2]  # Remove CE/PE
+        
+        # Extract strike price (last numeric part)
+        strike_match = _STRIKE_RE.search(base_symbol)
+        if not strike_match:
+            return {}
+        
+        strike_price = float(strike_match.group(1))
+        symbol_without_strike = base_symbol[:strike_match.start()]
+        
+        # Extract expiry date (format varies, e.g., 25DEC24, 2024DEC25)
+        expiry_match = _EXPIRY_RE.search(symbol_without_strike)
+        if expiry_match:
+            expiry_str = expiry_match.group(1)
+            underlying = symbol_without_strike[:expiry_match.start()]
+            
+            # Parse expiry date
+            expiry_date = _parse_expiry_date(expiry_str)
+        else:
+            underlying = symbol_without_strike
+            expiry_date = None
+        
+        return {
+            'underlying': underlying,
+            'strike_price': strike_price,
+            'expiry_date': expiry_date,
+            'option_type': option_type,
+            'symbol': symbol
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to parse options symbol {symbol}: {e}")
+        return {}
+
 
 class Zerodha(CustomExchange):
     """
@@ -53,9 +150,9 @@ class Zerodha(CustomExchange):
         "always_require_api_keys": True,
     }
 
-    # NSE Market Hours (IST)
-    NSE_MARKET_OPEN = "09:15"
-    NSE_MARKET_CLOSE = "15:30"
+    # NSE Market Hours (IST), shared with the calendar so they are never re-parsed
+    NSE_MARKET_OPEN = NSECalendar.MARKET_OPEN_TIME
+    NSE_MARKET_CLOSE = NSECalendar.MARKET_CLOSE_TIME
     
     # Supported trading modes
     _supported_trading_mode_margin_pairs = [
@@ -88,25 +185,55 @@ class Zerodha(CustomExchange):
         self._totp_token = exchange_config.get('totp_token', '')
         
         # Initialize Kite Connect
-        self._kite = KiteConnect(api_key=self._api_key)
+        self._kite = KiteConnect(api_key=self._api_key, pool=KITE_HTTP_POOL)
         self._access_token = None
         self._request_token = None
         
-        # WebSocket ticker
+        # Freqtrade -> Kite order parameter values
+        self._order_type_map = {
+            'limit': self._kite.ORDER_TYPE_LIMIT,
+            'market': self._kite.ORDER_TYPE_MARKET,
+        }
+        self._product_map = {
+            'MIS': self._kite.PRODUCT_MIS,
+            'CNC': self._kite.PRODUCT_CNC,
+            'NRML': self._kite.PRODUCT_NRML,
+        }
+        self._transaction_type_map = {
+            'buy': self._kite.TRANSACTION_TYPE_BUY,
+            'sell': self._kite.TRANSACTION_TYPE_SELL,
+        }
+        
+        # WebSocket ticker, and the latest tick per instrument token as (received_at, tick)
         self._kws = None
+        self._tick_cache: Dict[int, tuple[float, dict]] = {}
         
         # Default exchange
         self._default_exchange = exchange_config.get('nse_exchange', 'NSE')
         
-        # Instrument tokens cache
+        # Instrument tokens cache, backed by an on-disk copy of the day's instrument master
+        self._instruments_path = (
+            Path(config.get('user_data_dir', 'user_data')) / 'zerodha_instruments.parquet'
+        )
         self._instruments = {}
         self._symbol_to_token = {}
         
+        # Resolved pair -> (trading_symbol, instrument_token, exchange) conversions
+        self._pair_conversion_cache: Dict[str, tuple[str, str, str]] = {}
+        
+        # Option contracts indexed by underlying, and by (underlying, expiry)
+        self._options_by_underlying: Dict[str, List[dict]] = {}
+        self._options_by_expiry: Dict[tuple[str, date], List[dict]] = {}
+        
+        # Account order book indexed by order id, shared by order lookups within one
+        # polling tick and kept current by KiteTicker order updates
+        self._order_book_cache = TTLCache(maxsize=1, ttl=3)
+        
         # Session management
         self._session_expiry = None
 
-        # Initialize rate limiter (replaces manual rate limiting)
-        self._rate_limiter = BrokerRateLimits.get_limiter('zerodha')
+        # Initialize rate limiter, with Kite's per-endpoint limits
+        self._rate_limiter = BrokerRateLimits.get_endpoint_limiter('zerodha')
 
         # Initialize lot size manager
         self._lot_size_manager = LotSizeManager()
@@ -120,19 +247,35 @@ class Zerodha(CustomExchange):
         # Initialize markets from pair whitelist
         pair_whitelist = config.get('exchange', {}).get('pair_whitelist', [])
         self._init_markets_from_pairs(pair_whitelist, quote_currency='INR')
+        
+        # Resolve whitelist pairs up front, so trading calls only hit the conversion cache
+        for pair in pair_whitelist:
+            self._convert_symbol_to_kite(pair)
+        
+        # Stream whitelist quotes over KiteTicker, REST quotes remain the fallback
+        if exchange_config.get('enable_ws', True):
+            self._start_ticker(KiteTicker, pair_whitelist)
 
         logger.info(f"Zerodha exchange initialized for API key: {self._api_key[:8]}...")
         
     def _login(self):
         """Login to Kite Connect and get access token"""
         try:
-            # Check if we have stored access token
-            stored_token = self._get_stored_access_token()
-            if stored_token and self._is_token_valid(stored_token):
-                self._access_token = stored_token
-                self._kite.set_access_token(self._access_token)
-                logger.info("Using stored access token")
-                return
+            # Check if we have stored access token. Tokens stored with their expiry are
+            # trusted until shortly before it; older token files are checked against Kite.
+            stored_token, stored_expiry = self._get_stored_access_token()
+            if stored_token:
+                if stored_expiry is not None:
+                    token_valid = stored_expiry - datetime.now() > TOKEN_EXPIRY_MARGIN
+                else:
+                    token_valid = self._is_token_valid(stored_token)
+                
+                if token_valid:
+                    self._access_token = stored_token
+                    self._kite.set_access_token(self._access_token)
+                    self._session_expiry = stored_expiry
+                    logger.info("Using stored access token")
+                    return
             
             # Generate login URL for manual authentication
             login_url = self._kite.login_url()
@@ -157,12 +300,12 @@ class Zerodha(CustomExchange):
             self._access_token = data["access_token"]
             self._kite.set_access_token(self._access_token)
             
-            # Store access token for reuse
-            self._store_access_token(self._access_token)
-            
             # Set session expiry (Kite tokens expire at 6 AM next day)
             self._session_expiry = self._calculate_session_expiry()
             
+            # Store access token (with its expiry) for reuse
+            self._store_access_token(self._access_token)
+            
             logger.info("Zerodha login successful")
             
         except Exception as e:
@@ -176,36 +319,54 @@ class Zerodha(CustomExchange):
             return request_token
         
         # Check environment variable
-        import os
         return os.getenv('ZERODHA_REQUEST_TOKEN')
 
-    def _get_stored_access_token(self) -> Optional[str]:
-        """Get stored access token from file"""
+    def _get_stored_access_token(self) -> tuple[Optional[str], Optional[datetime]]:
+        """
+        Get stored access token from file.
+        
+        :return: Tuple of (access token, session expiry), None where unknown
+        """
         try:
-            import os
             token_file = os.path.expanduser('~/.freqtrade_zerodha_token')
             if os.path.exists(token_file):
-                with open(token_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('access_token')
+                with open(token_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                    expiry = data.get('expiry')
+                    return (
+                        data.get('access_token'),
+                        datetime.fromisoformat(expiry) if expiry else None
+                    )
         except Exception:
             pass
-        return None
+        return None, None
 
     def _store_access_token(self, token: str):
-        """Store access token to file"""
+        """
+        Store access token to file.
+        
+        The file is readable by the owner only and is replaced atomically, so a crash or
+        a concurrent process never leaves a truncated token behind.
+        """
+        tmp_file = None
         try:
-            import os
             token_file = os.path.expanduser('~/.freqtrade_zerodha_token')
             data = {
                 'access_token': token,
                 'timestamp': datetime.now().isoformat(),
                 'expiry': self._session_expiry.isoformat() if self._session_expiry else None
             }
-            with open(token_file, 'w') as f:
-                json.dump(data, f)
+            tmp_file = f"{token_file}.{os.getpid()}.tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, token_file)
         except Exception as e:
             logger.warning(f"Failed to store access token: {e}")
+            if tmp_file and os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
     def _is_token_valid(self, token: str) -> bool:
         """Check if access token is still valid"""
@@ -239,17 +400,24 @@ class Zerodha(CustomExchange):
     def _load_instruments(self):
         """Load instrument master data from Kite"""
         try:
-            self._rate_limit()
-            
-            # Fetch instruments for NSE and NFO
-            nse_instruments = self._kite.instruments("NSE")
-            nfo_instruments = self._kite.instruments("NFO")
-            
-            # Combine all instruments
-            all_instruments = nse_instruments + nfo_instruments
+            cached_instruments = self._read_instruments_cache()
+            if cached_instruments is None:
+                self._rate_limit('instruments')
+                
+                # Fetch instruments for NSE and NFO
+                nse_instruments = self._kite.instruments("NSE")
+                nfo_instruments = self._kite.instruments("NFO")
+                
+                # Walk both lists in turn rather than concatenating them
+                instrument_lists = (nse_instruments, nfo_instruments)
+                self._write_instruments_cache(chain.from_iterable(instrument_lists))
+            else:
+                instrument_lists = (cached_instruments,)
             
-            # Build symbol to token mapping
-            for instrument in all_instruments:
+            # Build symbol to token mapping and the option chain indexes
+            options_by_underlying = {}
+            options_by_expiry = {}
+            for instrument in chain.from_iterable(instrument_lists):
                 symbol = instrument['tradingsymbol']
                 token = instrument['instrument_token']
                 exchange = instrument['exchange']
@@ -257,13 +425,67 @@ class Zerodha(CustomExchange):
                 # Store in both directions
                 self._symbol_to_token[f"{symbol}:{exchange}"] = token
                 self._instruments[token] = instrument
+                
+                if instrument.get('instrument_type') in ('CE', 'PE'):
+                    underlying = instrument.get('name', '').upper()
+                    options_by_underlying.setdefault(underlying, []).append(instrument)
+                    options_by_expiry.setdefault(
+                        (underlying, instrument.get('expiry')), []
+                    ).append(instrument)
+            
+            # Option chains are served in (expiry, strike) order, sort them once here
+            for contracts in (*options_by_underlying.values(), *options_by_expiry.values()):
+                contracts.sort(key=lambda i: (i.get('expiry') or date.max, i.get('strike') or 0))
+            
+            self._options_by_underlying = options_by_underlying
+            self._options_by_expiry = options_by_expiry
+            self._pair_conversion_cache.clear()
             
-            logger.info(f"Loaded {len(all_instruments)} instruments from Kite")
+            logger.info(f"Loaded {sum(map(len, instrument_lists))} instruments from Kite")
             
         except Exception as e:
             logger.error(f"Failed to load instruments: {e}")
             # Continue without instruments - will use fallback methods
 
+    def _read_instruments_cache(self) -> Optional[List[dict]]:
+        """
+        Read the instrument master cached earlier today.
+        
+        Kite publishes a new instrument master every trading day, so older copies are ignored.
+        
+        :return: List of instruments, None if there is no usable cache
+        """
+        try:
+            modified = date.fromtimestamp(self._instruments_path.stat().st_mtime)
+            if modified != date.today():
+                return None
+            instruments = read_parquet(self._instruments_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached Kite instruments: {e}")
+            return None
+        
+        instruments['expiry'] = instruments['expiry'].map(
+            lambda expiry: date.fromisoformat(expiry) if expiry else ''
+        )
+        logger.info("Using cached Kite instrument master")
+        return instruments.to_dict('records')
+
+    def _write_instruments_cache(self, instruments: Iterable[dict]):
+        """Persist the instrument master to disk for reuse on the same day"""
+        try:
+            frame = DataFrame.from_records(instruments)
+            frame['expiry'] = frame['expiry'].map(
+                lambda expiry: expiry.isoformat() if expiry else ''
+            )
+            self._instruments_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._instruments_path.with_suffix('.tmp')
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self._instruments_path)
+        except Exception as e:
+            logger.warning(f"Failed to cache Kite instruments: {e}")
+
     def _get_instrument_token(self, symbol: str, exchange: str = None) -> Optional[str]:
         """
         Get instrument token for a symbol.
@@ -285,17 +507,22 @@ class Zerodha(CustomExchange):
         :param pair: Freqtrade pair (e.g., 'SBIN/INR', 'NIFTY25DEC24500CE/INR')
         :return: Tuple of (trading_symbol, instrument_token, exchange)
         """
+        converted = self._pair_conversion_cache.get(pair)
+        if converted is not None:
+            return converted
+        
         # Remove quote currency
-        symbol = pair.split('/')[0]
+        symbol = pair.partition('/')[0]
+        pair_upper = pair.upper()
         
         # Determine if it's options
         if self._is_options_symbol(symbol):
             exchange = 'NFO'
             trading_symbol = symbol
-        elif 'NFO' in pair.upper():
+        elif 'NFO' in pair_upper:
             exchange = 'NFO'
             trading_symbol = symbol
-        elif 'BSE' in pair.upper():
+        elif 'BSE' in pair_upper:
             exchange = 'BSE'
             trading_symbol = symbol
         else:
@@ -307,9 +534,12 @@ class Zerodha(CustomExchange):
         
         if not instrument_token:
             logger.warning(f"Instrument token not found for {trading_symbol}:{exchange}")
-            instrument_token = "0"  # Fallback
-            
-        return trading_symbol, instrument_token, exchange
+            return trading_symbol, "0", exchange  # Fallback
+        
+        # Unknown tokens are retried once the instruments are (re)loaded
+        converted = (trading_symbol, instrument_token, exchange)
+        self._pair_conversion_cache[pair] = converted
+        return converted
 
     def _is_options_symbol(self, symbol: str) -> bool:
         """Check if symbol is an options contract"""
@@ -326,56 +556,134 @@ class Zerodha(CustomExchange):
         if not self._is_options_symbol(symbol):
             return {}
         
-        try:
-            # Extract option type (CE/PE)
-            option_type = 'CALL' if symbol.endswith('CE') else 'PUT'
-            base_symbol = symbol[:-2]  # Remove CE/PE
-            
-            # Extract strike price (last numeric part)
-            import re
-            strike_match = re.search(r'(\d+)$', base_symbol)
-            if not strike_match:
-                return {}
-            
-            strike_price = float(strike_match.group(1))
-            symbol_without_strike = base_symbol[:strike_match.start()]
-            
-            # Extract expiry date (format varies, e.g., 25DEC24, 2024DEC25)
-            expiry_match = re.search(r'(\d{1,2}[A-Z]{3}\d{2,4}|\d{4}[A-Z]{3}\d{1,2})$', symbol_without_strike)
-            if expiry_match:
-                expiry_str = expiry_match.group(1)
-                underlying = symbol_without_strike[:expiry_match.start()]
-                
-                # Parse expiry date
-                expiry_date = self._parse_expiry_date(expiry_str)
-            else:
-                underlying = symbol_without_strike
-                expiry_date = None
-            
-            return {
-                'underlying': underlying,
-                'strike_price': strike_price,
-                'expiry_date': expiry_date,
-                'option_type': option_type,
-                'symbol': symbol
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to parse options symbol {symbol}: {e}")
-            return {}
+        return dict(_parse_options_symbol(symbol))
 
     def _parse_expiry_date(self, expiry_str: str) -> Optional[datetime]:
         """Parse expiry date string to datetime"""
+        return _parse_expiry_date(expiry_str)
+
+    def _start_ticker(self, ticker_class, pairs: List[str]):
+        """
+        Subscribe to full-mode KiteTicker updates for the given pairs.
+        
+        :param ticker_class: KiteTicker class
+        :param pairs: Freqtrade pairs to stream
+        """
+        tokens = []
+        for pair in pairs:
+            trading_symbol, instrument_token, exchange = self._convert_symbol_to_kite(pair)
+            if instrument_token != "0":
+                tokens.append(int(instrument_token))
+        
+        if not tokens:
+            return
+        
+        def on_connect(ws, response):
+            ws.subscribe(tokens)
+            ws.set_mode(ws.MODE_FULL, tokens)
+        
+        def on_ticks(ws, ticks):
+            received_at = time.monotonic()
+            for tick in ticks:
+                self._tick_cache[tick['instrument_token']] = (received_at, tick)
+        
+        def on_order_update(ws, data):
+            with self._cache_lock:
+                order_index = self._order_book_cache.get('orders')
+                if order_index is not None:
+                    order_index[data.get('order_id')] = data
+        
         try:
-            # Handle different formats
-            if len(expiry_str) == 7:  # 25DEC24
-                return datetime.strptime(expiry_str, '%d%b%y')
-            elif len(expiry_str) == 9:  # 2024DEC25
-                return datetime.strptime(expiry_str, '%Y%b%d')
-            else:
-                return None
-        except Exception:
+            self._kws = ticker_class(self._api_key, self._access_token)
+            self._kws.on_connect = on_connect
+            self._kws.on_ticks = on_ticks
+            self._kws.on_order_update = on_order_update
+            self._kws.connect(threaded=True)
+            logger.info(f"KiteTicker streaming {len(tokens)} instruments")
+        except Exception as e:
+            self._kws = None
+            logger.warning(f"Failed to start KiteTicker, using REST quotes only: {e}")
+
+    def _cached_quote(self, instrument_token) -> Optional[dict]:
+        """
+        Get a quote built from a recent KiteTicker tick.
+        
+        :param instrument_token: Instrument token
+        :return: Quote in Kite quote API layout, None if there is no fresh tick
+        """
+        cached = self._tick_cache.get(int(instrument_token))
+        if not cached or time.monotonic() - cached[0] > TICK_MAX_AGE:
             return None
+        
+        tick = cached[1]
+        return {
+            'last_price': tick.get('last_price', 0),
+            'volume': tick.get('volume_traded', 0),
+            'depth': tick.get('depth', {}),
+        }
+
+    def _fetch_quotes(self, pairs: List[str]) -> Dict[str, dict]:
+        """
+        Fetch full quotes for many pairs with as few requests as possible.
+        
+        Pairs with a fresh KiteTicker tick are served from it without a request.
+        
+        :param pairs: Freqtrade pairs
+        :return: Dict of pair -> Kite quote (empty dict if Kite returned none)
+        """
+        streamed = {}
+        instrument_keys = {}
+        for pair in pairs:
+            trading_symbol, instrument_token, exchange = self._convert_symbol_to_kite(pair)
+            quote = self._cached_quote(instrument_token) if self._tick_cache else None
+            if quote is not None:
+                streamed[pair] = quote
+            else:
+                instrument_keys[pair] = f"{exchange}:{instrument_token}"
+        
+        keys = list(dict.fromkeys(instrument_keys.values()))
+        quotes = {}
+        for start in range(0, len(keys), QUOTE_INSTRUMENT_LIMIT):
+            self._rate_limit('quote')
+            quotes.update(self._kite.quote(keys[start:start + QUOTE_INSTRUMENT_LIMIT]))
+        
+        return {
+            pair: streamed[pair] if pair in streamed else quotes.get(instrument_keys[pair], {})
+            for pair in pairs
+        }
+
+    @staticmethod
+    def _quote_ticker(pair: str, quote: dict) -> Ticker:
+        """Build a ticker from a Kite quote"""
+        depth = quote.get('depth', {})
+        best_ask = (depth.get('sell') or [{}])[0]
+        best_bid = (depth.get('buy') or [{}])[0]
+        
+        return {
+            'symbol': pair,
+            'ask': best_ask.get('price'),
+            'bid': best_bid.get('price'),
+            'last': quote.get('last_price', 0),
+            'askVolume': best_ask.get('quantity'),
+            'bidVolume': best_bid.get('quantity'),
+            'quoteVolume': quote.get('volume', 0),
+            'baseVolume': quote.get('volume', 0),
+            'percentage': None,
+        }
+
+    @staticmethod
+    def _quote_order_book(pair: str, quote: dict, limit: int) -> OrderBook:
+        """Build an order book from a Kite quote"""
+        depth = quote.get('depth', {})
+        
+        return {
+            'symbol': pair,
+            'bids': [(d['price'], d['quantity']) for d in depth.get('buy', [])[:limit]],
+            'asks': [(d['price'], d['quantity']) for d in depth.get('sell', [])[:limit]],
+            'timestamp': None,
+            'datetime': None,
+            'nonce': None,
+        }
 
     def fetch_ticker(self, pair: str) -> Ticker:
         """
@@ -384,34 +692,24 @@ class Zerodha(CustomExchange):
         :param pair: Freqtrade pair
         :return: Ticker data
         """
-        trading_symbol, instrument_token, exchange = self._convert_symbol_to_kite(pair)
+        return self.fetch_tickers([pair])[pair]
+
+    def fetch_tickers(self, symbols: List[str] | None = None) -> Dict[str, Ticker]:
+        """
+        Fetch tickers for multiple pairs.
         
+        Uses one Kite quote request per QUOTE_INSTRUMENT_LIMIT instruments.
+        
+        :param symbols: List of pairs to fetch (None for all markets)
+        :return: Dictionary of pair -> ticker
+        """
+        pairs = symbols if symbols else list(self._markets.keys())
         try:
-            self._rate_limit()
-            
-            # Fetch LTP (Last Traded Price)
-            ltp_data = self._kite.ltp([f"{exchange}:{instrument_token}"])
-            
-            # Fetch quote for more detailed data
-            quote_data = self._kite.quote([f"{exchange}:{instrument_token}"])
-            
-            token_key = f"{exchange}:{instrument_token}"
-            ltp = ltp_data.get(token_key, {}).get('last_price', 0)
-            quote = quote_data.get(token_key, {})
-            
-            return {
-                'symbol': pair,
-                'ask': quote.get('depth', {}).get('sell', [{}])[0].get('price'),
-                'bid': quote.get('depth', {}).get('buy', [{}])[0].get('price'),
-                'last': ltp,
-                'askVolume': quote.get('depth', {}).get('sell', [{}])[0].get('quantity'),
-                'bidVolume': quote.get('depth', {}).get('buy', [{}])[0].get('quantity'),
-                'quoteVolume': quote.get('volume', 0),
-                'baseVolume': quote.get('volume', 0),
-                'percentage': None,
-            }
+            quotes = self._fetch_quotes(pairs)
         except Exception as e:
-            raise ExchangeError(f"Failed to fetch ticker for {pair}: {e}")
+            raise ExchangeError(f"Failed to fetch tickers: {e}")
+        
+        return {pair: self._quote_ticker(pair, quote) for pair, quote in quotes.items()}
 
     def fetch_order_book(self, pair: str, limit: int = 5) -> OrderBook:
         """
@@ -421,31 +719,26 @@ class Zerodha(CustomExchange):
         :param limit: Depth limit
         :return: Order book data
         """
-        trading_symbol, instrument_token, exchange = self._convert_symbol_to_kite(pair)
+        return self.fetch_order_books([pair], limit)[pair]
+
+    def fetch_order_books(self, pairs: List[str], limit: int = 5) -> Dict[str, OrderBook]:
+        """
+        Fetch order books (market depth) for multiple pairs.
+        
+        Uses one Kite quote request per QUOTE_INSTRUMENT_LIMIT instruments.
         
+        :param pairs: Freqtrade pairs
+        :param limit: Depth limit
+        :return: Dictionary of pair -> order book
+        """
         try:
-            self._rate_limit()
-            
-            quote_data = self._kite.quote([f"{exchange}:{instrument_token}"])
-            token_key = f"{exchange}:{instrument_token}"
-            quote = quote_data.get(token_key, {})
-            
-            depth = quote.get('depth', {})
-            
-            # Extract asks and bids
-            asks = [(d['price'], d['quantity']) for d in depth.get('sell', [])[:limit]]
-            bids = [(d['price'], d['quantity']) for d in depth.get('buy', [])[:limit]]
-            
-            return {
-                'symbol': pair,
-                'bids': bids,
-                'asks': asks,
-                'timestamp': None,
-                'datetime': None,
-                'nonce': None,
-            }
+            quotes = self._fetch_quotes(pairs)
         except Exception as e:
-            raise ExchangeError(f"Failed to fetch order book for {pair}: {e}")
+            raise ExchangeError(f"Failed to fetch order books: {e}")
+        
+        return {
+            pair: self._quote_order_book(pair, quote, limit) for pair, quote in quotes.items()
+        }
 
     def fetch_ohlcv(
         self,
@@ -490,7 +783,7 @@ class Zerodha(CustomExchange):
         to_date = datetime.now().date()
         
         try:
-            self._rate_limit()
+            self._rate_limit('historical_data')
             
             # Fetch historical data
             data = self._kite.historical_data(
@@ -501,17 +794,7 @@ class Zerodha(CustomExchange):
             )
             
             # Convert to OHLCV format: [timestamp, open, high, low, close, volume]
-            ohlcv = []
-            for candle in data:
-                timestamp = int(candle['date'].timestamp() * 1000)
-                ohlcv.append([
-                    timestamp,
-                    float(candle['open']),
-                    float(candle['high']),
-                    float(candle['low']),
-                    float(candle['close']),
-                    float(candle['volume'])
-                ])
+            ohlcv = self._convert_candles(data)
             
             # Apply limit
             if limit:
@@ -522,6 +805,66 @@ class Zerodha(CustomExchange):
         except Exception as e:
             raise ExchangeError(f"Failed to fetch OHLCV for {pair}: {e}")
 
+    def fetch_ohlcv_batch(
+        self,
+        pairs: List[str],
+        timeframe: str = '5m',
+        since: int | None = None,
+        limit: int | None = None,
+        candle_type: CandleType = CandleType.SPOT,
+    ) -> Dict[str, list]:
+        """
+        Fetch OHLCV data for several pairs.
+        
+        Kite serves one instrument per historical_data request, so the requests are sent
+        concurrently (up to OHLCV_FETCH_WORKERS at a time) instead of one after another.
+        The historical_data rate limit still applies to each of them.
+        
+        :param pairs: Freqtrade pairs
+        :param timeframe: Timeframe
+        :param since: Timestamp in milliseconds
+        :param limit: Number of candles
+        :param candle_type: Candle type
+        :return: Dictionary of pair -> OHLCV data (pairs that failed are left out)
+        """
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(OHLCV_FETCH_WORKERS, len(pairs)))
+        ) as executor:
+            futures = {
+                pair: executor.submit(
+                    self.fetch_ohlcv, pair, timeframe, since, limit, candle_type
+                )
+                for pair in pairs
+            }
+        
+        ohlcv = {}
+        for pair, future in futures.items():
+            try:
+                ohlcv[pair] = future.result()
+            except ExchangeError as e:
+                logger.warning(e)
+        return ohlcv
+
+    @staticmethod
+    def _convert_candles(data: List[dict]) -> list:
+        """
+        Convert Kite historical candles to OHLCV format.
+        
+        :param data: Kite candles (dicts with date, open, high, low, close, volume)
+        :return: List of [timestamp_ms, open, high, low, close, volume]
+        """
+        if not data:
+            return []
+        
+        candles = DataFrame(data)
+        timestamps = to_datetime(candles['date'], utc=True).dt.as_unit('ms').astype('int64')
+        values = candles[['open', 'high', 'low', 'close', 'volume']].astype('float64')
+        
+        return [
+            [timestamp, *row]
+            for timestamp, row in zip(timestamps.tolist(), values.to_numpy().tolist())
+        ]
+
     def create_order(
         self,
         pair: str,
@@ -548,29 +891,18 @@ class Zerodha(CustomExchange):
         params = params or {}
         
         # Map order type
-        if ordertype == 'limit':
-            order_type = self._kite.ORDER_TYPE_LIMIT
-        elif ordertype == 'market':
-            order_type = self._kite.ORDER_TYPE_MARKET
-        else:
-            order_type = self._kite.ORDER_TYPE_LIMIT
+        order_type = self._order_type_map.get(ordertype, self._kite.ORDER_TYPE_LIMIT)
         
         # Get product type (default to MIS - Margin Intraday Squareoff)
-        product_type = params.get('product', 'MIS')
-        if product_type == 'MIS':
-            product = self._kite.PRODUCT_MIS
-        elif product_type == 'CNC':
-            product = self._kite.PRODUCT_CNC
-        elif product_type == 'NRML':
-            product = self._kite.PRODUCT_NRML
-        else:
-            product = self._kite.PRODUCT_MIS
+        product = self._product_map.get(params.get('product', 'MIS'), self._kite.PRODUCT_MIS)
         
         # Determine transaction type
-        transaction_type = self._kite.TRANSACTION_TYPE_BUY if side == 'buy' else self._kite.TRANSACTION_TYPE_SELL
+        transaction_type = self._transaction_type_map.get(
+            side, self._kite.TRANSACTION_TYPE_SELL
+        )
         
         try:
-            self._rate_limit()
+            self._rate_limit('place_order')
             
             order_id = self._kite.place_order(
                 variety=self._kite.VARIETY_REGULAR,
@@ -584,6 +916,7 @@ class Zerodha(CustomExchange):
                 validity=self._kite.VALIDITY_DAY,
                 tag="freqtrade"
             )
+            self._invalidate_order_caches()
             
             return {
                 'id': order_id,
@@ -616,16 +949,7 @@ class Zerodha(CustomExchange):
         :return: Order data
         """
         try:
-            self._rate_limit()
-            
-            orders = self._kite.orders()
-            
-            # Find the specific order
-            order = None
-            for o in orders:
-                if o.get('order_id') == order_id:
-                    order = o
-                    break
+            order = self._get_order_index().get(order_id)
             
             if not order:
                 raise InvalidOrderException(f"Order {order_id} not found")
@@ -671,12 +995,13 @@ class Zerodha(CustomExchange):
         :return: Order data
         """
         try:
-            self._rate_limit()
+            self._rate_limit('cancel_order')
             
             response = self._kite.cancel_order(
                 variety=self._kite.VARIETY_REGULAR,
                 order_id=order_id
             )
+            self._invalidate_order_caches()
             
             return {
                 'id': order_id,
@@ -687,6 +1012,67 @@ class Zerodha(CustomExchange):
         except Exception as e:
             raise ExchangeError(f"Failed to cancel order {order_id}: {e}")
 
+    def cancel_orders(self, order_ids: List[str], pair: str) -> List[dict | Exception]:
+        """
+        Cancel several orders at once.
+        
+        Kite cancels one order per request, so the requests are sent concurrently
+        (up to ORDER_CANCEL_WORKERS at a time) instead of one after another.
+        The cancel_order rate limit still applies to each of them.
+        A failed cancel does not hide the others - every order gets its own result.
+        
+        :param order_ids: Order IDs
+        :param pair: Freqtrade pair
+        :return: Order data, or the exception raised for that order, in the same order
+                 as the given order IDs
+        """
+        def cancel(order_id: str) -> dict | Exception:
+            try:
+                return self.cancel_order(order_id, pair)
+            except Exception as e:
+                logger.warning(f"Failed to cancel order {order_id}: {e}")
+                return e
+        
+        if len(order_ids) <= 1:
+            return [cancel(order_id) for order_id in order_ids]
+        
+        with ThreadPoolExecutor(
+            max_workers=min(ORDER_CANCEL_WORKERS, len(order_ids))
+        ) as executor:
+            return list(executor.map(cancel, order_ids))
+
+    def _invalidate_order_caches(self) -> None:
+        """
+        Drop the cached order book after an order was placed or cancelled.
+        
+        Orders may be cancelled from several threads at once (cancel_orders), so the
+        cache is only touched under the cache lock.
+        """
+        with self._cache_lock:
+            self._order_book_cache.clear()
+
+    def _get_order_index(self) -> Dict[str, dict]:
+        """
+        Get the account order book indexed by order id.
+        
+        The result is cached for a few seconds so that repeated order lookups
+        within one polling tick share a single orders() request.
+        
+        :return: Dict of order id -> Kite order
+        """
+        with self._cache_lock:
+            order_index = self._order_book_cache.get('orders')
+        if order_index is not None:
+            return order_index
+        
+        # Fetch without holding the lock, so ticker callbacks are not blocked meanwhile
+        self._rate_limit('orders')
+        
+        order_index = {o.get('order_id'): o for o in self._kite.orders()}
+        with self._cache_lock:
+            self._order_book_cache['orders'] = order_index
+        return order_index
+
     def fetch_balance(self) -> dict:
         """
         Fetch account balance.
@@ -694,7 +1080,7 @@ class Zerodha(CustomExchange):
         :return: Balance data
         """
         try:
-            self._rate_limit()
+            self._rate_limit('margins')
             
             margins = self._kite.margins()
             equity = margins.get('equity', {})
@@ -727,7 +1113,7 @@ class Zerodha(CustomExchange):
         :return: List of positions
         """
         try:
-            self._rate_limit()
+            self._rate_limit('positions')
             
             positions = self._kite.positions()
             return positions.get('day', []) + positions.get('net', [])
@@ -744,28 +1130,27 @@ class Zerodha(CustomExchange):
         :return: List of option contracts
         """
         try:
-            # Filter instruments for options of the underlying
-            option_contracts = []
-            
-            for token, instrument in self._instruments.items():
-                if (instrument.get('name', '').upper() == underlying.upper() and 
-                    instrument.get('instrument_type') in ['CE', 'PE']):
-                    
-                    if expiry and instrument.get('expiry'):
-                        # Filter by expiry if specified
-                        if instrument['expiry'].strftime('%Y-%m-%d') != expiry:
-                            continue
-                    
-                    option_contracts.append({
-                        'symbol': instrument['tradingsymbol'],
-                        'strike': instrument.get('strike', 0),
-                        'expiry': instrument.get('expiry'),
-                        'option_type': 'CALL' if instrument.get('instrument_type') == 'CE' else 'PUT',
-                        'lot_size': instrument.get('lot_size', 1),
-                        'instrument_token': token,
-                    })
-            
-            return sorted(option_contracts, key=lambda x: (x['expiry'], x['strike']))
+            # Only look at the options of the underlying (and expiry, if given)
+            underlying = underlying.upper()
+            if expiry:
+                instruments = self._options_by_expiry.get(
+                    (underlying, date.fromisoformat(expiry)), ()
+                )
+            else:
+                instruments = self._options_by_underlying.get(underlying, ())
+            
+            # The indexes are already sorted by (expiry, strike)
+            return [
+                {
+                    'symbol': instrument['tradingsymbol'],
+                    'strike': instrument.get('strike', 0),
+                    'expiry': instrument.get('expiry'),
+                    'option_type': 'CALL' if instrument.get('instrument_type') == 'CE' else 'PUT',
+                    'lot_size': instrument.get('lot_size', 1),
+                    'instrument_token': instrument['instrument_token'],
+                }
+                for instrument in instruments
+            ]
             
         except Exception as e:
             raise ExchangeError(f"Failed to fetch option chain for {underlying}: {e}")
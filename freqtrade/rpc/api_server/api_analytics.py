@@ -2,32 +2,140 @@
 Analytics API for PaperBroker - Provides backtest-style metrics for live paper trading
 """
 import logging
-from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ColumnElement, Row, and_, case, func, select, text
 
 from freqtrade.persistence import Trade
 from freqtrade.rpc.api_server.deps import get_config, get_rpc
+from freqtrade.rpc.api_server.webserver import FTJSONResponse
 from freqtrade.rpc.rpc import RPC, RPCException
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Overview payloads (without the live balance), keyed by a cheap summary of the trade table
+OVERVIEW_CACHE_TTL = 5  # seconds
+_overview_cache: TTLCache = TTLCache(maxsize=4, ttl=OVERVIEW_CACHE_TTL)
+_OVERVIEW_HEADERS = {'Cache-Control': f'private, max-age={OVERVIEW_CACHE_TTL}'}
+
+# Overview metrics reported with two decimals
+_ROUNDED_OVERVIEW_KEYS = (
+    'total_profit', 'total_profit_percent', 'win_rate', 'avg_profit',
+    'avg_profit_winning', 'avg_profit_losing', 'avg_duration',
+)
+
+# Rows fetched per database round trip when streaming trades as NDJSON
+TRADES_STREAM_BATCH = 500
+_TRADE_COLUMNS = (
+    Trade.id, Trade.pair, Trade.is_open, Trade.open_date, Trade.open_rate,
+    Trade.close_date, Trade.close_rate, Trade.amount, Trade.stake_amount,
+    Trade.close_profit_abs, Trade.close_profit, Trade.enter_tag, Trade.exit_reason,
+)
+
+
+def _max_streaks(is_win: np.ndarray) -> tuple[int, int]:
+    """
+    Get the longest winning and losing streaks.
+    
+    :param is_win: Boolean array, True for each winning trade in closing order
+    :return: Tuple of (max win streak, max loss streak)
+    """
+    if not len(is_win):
+        return 0, 0
+    
+    # Start index and length of every run of equal outcomes
+    starts = np.flatnonzero(np.r_[True, is_win[1:] != is_win[:-1]])
+    lengths = np.diff(np.r_[starts, len(is_win)])
+    run_is_win = is_win[starts]
+    
+    return int(lengths[run_is_win].max(initial=0)), int(lengths[~run_is_win].max(initial=0))
+
+
+def _duration_minutes(dialect: str) -> ColumnElement:
+    """
+    SQL expression for the trade duration in minutes.
+    Date arithmetic differs between the supported databases.
+    
+    :param dialect: Name of the database dialect
+    :return: Column expression, NULL while open or close date is missing
+    """
+    if dialect == 'sqlite':
+        return (func.julianday(Trade.close_date) - func.julianday(Trade.open_date)) * 1440
+    if dialect in ('mysql', 'mariadb'):
+        return func.timestampdiff(text('SECOND'), Trade.open_date, Trade.close_date) / 60
+    return func.extract('epoch', Trade.close_date - Trade.open_date) / 60
+
+
+def _trade_summary(trade: Row) -> dict[str, Any]:
+    """
+    Summarize a trade for the best/worst trade fields.
+    
+    :param trade: Closed trade row (pair, profits, open and close date)
+    :return: Dict with pair, profit and ISO formatted dates
+    """
+    open_date = trade.open_date
+    close_date = trade.close_date
+    return {
+        'pair': trade.pair,
+        'profit': trade.close_profit_abs,
+        'profit_percent': trade.close_profit,
+        'open_date': open_date.isoformat() if open_date else None,
+        'close_date': close_date.isoformat() if close_date else None,
+    }
+
 
 @router.get('/analytics/overview', response_model=dict[str, Any], tags=['analytics'])
 async def analytics_overview(rpc: RPC = Depends(get_rpc)):
     """
     Get comprehensive analytics overview for Paper Trading
     Returns backtest-style metrics for current trading session
+    Results are reused for a few seconds while no trade was opened or closed.
+    The payload is serialized by orjson directly, skipping response model validation.
     """
     try:
-        # Get all trades
-        trades = Trade.get_trades([]).all()
+        # Trade counts, total profit, the winning/losing split and the average duration,
+        # aggregated by the database
+        closed_filter = Trade.is_open.is_(False)
+        winner = and_(closed_filter, Trade.close_profit_abs > 0)
+        loser = and_(closed_filter, Trade.close_profit_abs <= 0)
+        duration = _duration_minutes(Trade.session.get_bind().dialect.name)
+        totals = Trade.session.execute(
+            select(
+                func.count(Trade.id),
+                func.count(case((Trade.is_open.is_(True), Trade.id))),
+                func.coalesce(func.sum(case((closed_filter, Trade.close_profit_abs))), 0),
+                func.max(Trade.close_date),
+                func.count(case((winner, Trade.id))),
+                func.coalesce(func.sum(case((winner, Trade.close_profit_abs))), 0),
+                func.coalesce(func.sum(case((loser, Trade.close_profit_abs))), 0),
+                func.avg(case((closed_filter, duration))),
+            )
+        ).one()
+        (
+            total_trades, open_trade_count, total_profit, last_close_date,
+            win_n, winners_sum, losers_sum, avg_duration,
+        ) = totals
+        
+        cache_key = tuple(totals)
+        overview = _overview_cache.get(cache_key)
+        if overview is not None:
+            return FTJSONResponse(
+                {
+                    **overview,
+                    'current_balance': rpc._freqtrade.wallets.get_total_stake_amount(),
+                },
+                headers=_OVERVIEW_HEADERS,
+            )
         
-        if not trades:
-            return {
+        if not total_trades:
+            return FTJSONResponse({
                 'total_trades': 0,
                 'open_trades': 0,
                 'closed_trades': 0,
@@ -40,153 +148,176 @@ async def analytics_overview(rpc: RPC = Depends(get_rpc)):
                 'worst_trade': None,
                 'equity_curve': [],
                 'daily_profit': [],
-            }
+            }, headers=_OVERVIEW_HEADERS)
         
-        # Separate open and closed trades
-        open_trades = [t for t in trades if t.is_open]
-        closed_trades = [t for t in trades if not t.is_open]
+        closed_trade_count = total_trades - open_trade_count
         
-        # Calculate metrics
-        total_profit = sum(t.close_profit_abs or 0 for t in closed_trades)
-        winning_trades = [t for t in closed_trades if (t.close_profit_abs or 0) > 0]
-        losing_trades = [t for t in closed_trades if (t.close_profit_abs or 0) <= 0]
+        # Best and worst trades, with just the columns of their summaries
+        profit_abs = func.coalesce(Trade.close_profit_abs, 0)
+        summary_query = select(
+            Trade.pair, Trade.close_profit_abs, Trade.close_profit, Trade.open_date, Trade.close_date
+        ).filter(closed_filter)
+        best = Trade.session.execute(
+            summary_query.order_by(profit_abs.desc(), Trade.id).limit(1)
+        ).first()
+        worst = Trade.session.execute(
+            summary_query.order_by(profit_abs.asc(), Trade.id).limit(1)
+        ).first()
         
-        win_rate = (len(winning_trades) / len(closed_trades) * 100) if closed_trades else 0
-        avg_profit = (total_profit / len(closed_trades)) if closed_trades else 0
+        best_trade = _trade_summary(best) if best is not None else None
+        worst_trade = _trade_summary(worst) if worst is not None else None
         
-        # Average duration
-        durations = []
-        for t in closed_trades:
-            if t.close_date and t.open_date:
-                duration = (t.close_date - t.open_date).total_seconds() / 60  # minutes
-                durations.append(duration)
-        avg_duration = (sum(durations) / len(durations)) if durations else 0
+        # Per-trade metrics only need a few columns of the closed trades, fetched in closing
+        # order for the equity curve and the streaks
+        closed_rows = Trade.session.execute(
+            select(Trade.close_date, Trade.close_profit_abs, Trade.id, Trade.pair)
+            .filter(closed_filter)
+            .order_by(Trade.close_date.asc().nulls_first(), Trade.id)
+        ).all()
         
-        # Best and worst trades
-        best_trade = None
-        worst_trade = None
-        if closed_trades:
-            best = max(closed_trades, key=lambda t: t.close_profit_abs or 0)
-            worst = min(closed_trades, key=lambda t: t.close_profit_abs or 0)
-            
-            best_trade = {
-                'pair': best.pair,
-                'profit': best.close_profit_abs,
-                'profit_percent': best.close_profit,
-                'open_date': best.open_date.isoformat() if best.open_date else None,
-                'close_date': best.close_date.isoformat() if best.close_date else None,
-            }
-            
-            worst_trade = {
-                'pair': worst.pair,
-                'profit': worst.close_profit_abs,
-                'profit_percent': worst.close_profit,
-                'open_date': worst.open_date.isoformat() if worst.open_date else None,
-                'close_date': worst.close_date.isoformat() if worst.close_date else None,
-            }
+        # Equity curve and streaks are vectorized over the profit column
+        profits = np.fromiter(
+            (row[1] or 0 for row in closed_rows), dtype=np.float64, count=len(closed_rows)
+        )
+        max_win_streak, max_loss_streak = _max_streaks(profits > 0)
         
-        # Equity curve (cumulative profit over time)
         equity_curve = []
-        cumulative_profit = 0
-        for t in sorted(closed_trades, key=lambda x: x.close_date or datetime.min):
-            cumulative_profit += (t.close_profit_abs or 0)
+        daily_profit = []
+        current_day = None
+        for (close_date, profit, trade_id, pair), cumulative_profit in zip(
+            closed_rows, np.cumsum(profits).tolist()
+        ):
+            # Equity curve (cumulative profit over time)
             equity_curve.append({
-                'date': t.close_date.isoformat() if t.close_date else None,
+                'date': close_date.isoformat() if close_date else None,
                 'profit': cumulative_profit,
-                'trade_id': t.id,
-                'pair': t.pair,
+                'trade_id': trade_id,
+                'pair': pair,
             })
+            
+            # Daily profit aggregation - rows arrive in closing order, one bucket per day
+            if close_date:
+                close_day = close_date.date()
+                if close_day != current_day:
+                    current_day = close_day
+                    day_bucket = {'date': close_day.isoformat(), 'profit': 0}
+                    daily_profit.append(day_bucket)
+                day_bucket['profit'] += profit or 0
         
-        # Daily profit aggregation
-        daily_profits = {}
-        for t in closed_trades:
-            if t.close_date:
-                date_key = t.close_date.strftime('%Y-%m-%d')
-                daily_profits[date_key] = daily_profits.get(date_key, 0) + (t.close_profit_abs or 0)
-        
-        daily_profit = [
-            {'date': date, 'profit': profit}
-            for date, profit in sorted(daily_profits.items())
-        ]
-        
-        # Win/Loss streak
-        streaks = []
-        current_streak = 0
-        current_type = None
-        
-        for t in sorted(closed_trades, key=lambda x: x.close_date or datetime.min):
-            is_win = (t.close_profit_abs or 0) > 0
-            if current_type is None:
-                current_type = 'win' if is_win else 'loss'
-                current_streak = 1
-            elif (current_type == 'win' and is_win) or (current_type == 'loss' and not is_win):
-                current_streak += 1
-            else:
-                streaks.append({'type': current_type, 'count': current_streak})
-                current_type = 'win' if is_win else 'loss'
-                current_streak = 1
-        
-        if current_streak > 0:
-            streaks.append({'type': current_type, 'count': current_streak})
-        
-        max_win_streak = max([s['count'] for s in streaks if s['type'] == 'win'], default=0)
-        max_loss_streak = max([s['count'] for s in streaks if s['type'] == 'loss'], default=0)
+        loss_n = closed_trade_count - win_n
+        win_rate = (win_n / closed_trade_count * 100) if closed_trade_count else 0
+        avg_profit = (total_profit / closed_trade_count) if closed_trade_count else 0
+        avg_duration = float(avg_duration or 0)  # minutes
         
-        return {
-            'total_trades': len(trades),
-            'open_trades': len(open_trades),
-            'closed_trades': len(closed_trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
-            'total_profit': round(total_profit, 2),
-            'total_profit_percent': round((total_profit / 100000) * 100, 2) if total_profit else 0,
-            'win_rate': round(win_rate, 2),
-            'avg_profit': round(avg_profit, 2),
-            'avg_profit_winning': round(sum(t.close_profit_abs or 0 for t in winning_trades) / len(winning_trades), 2) if winning_trades else 0,
-            'avg_profit_losing': round(sum(t.close_profit_abs or 0 for t in losing_trades) / len(losing_trades), 2) if losing_trades else 0,
-            'avg_duration': round(avg_duration, 2),
+        overview = {
+            'total_trades': total_trades,
+            'open_trades': open_trade_count,
+            'closed_trades': closed_trade_count,
+            'winning_trades': win_n,
+            'losing_trades': loss_n,
+            'total_profit': total_profit,
+            'total_profit_percent': (total_profit / 100000) * 100 if total_profit else 0,
+            'win_rate': win_rate,
+            'avg_profit': avg_profit,
+            'avg_profit_winning': winners_sum / win_n if win_n else 0,
+            'avg_profit_losing': losers_sum / loss_n if loss_n else 0,
+            'avg_duration': avg_duration,
             'best_trade': best_trade,
             'worst_trade': worst_trade,
             'equity_curve': equity_curve,
             'daily_profit': daily_profit,
             'max_win_streak': max_win_streak,
             'max_loss_streak': max_loss_streak,
-            'current_balance': rpc._freqtrade.wallets.get_total_stake_amount(),
         }
+        overview.update({key: round(overview[key], 2) for key in _ROUNDED_OVERVIEW_KEYS})
+        _overview_cache[cache_key] = overview
+        
+        return FTJSONResponse(
+            {
+                **overview,
+                'current_balance': rpc._freqtrade.wallets.get_total_stake_amount(),
+            },
+            headers=_OVERVIEW_HEADERS,
+        )
         
     except Exception as e:
         logger.exception("Error generating analytics overview")
         raise RPCException(f"Error generating analytics: {str(e)}")
 
 
+def _trade_row(row: Row) -> dict[str, Any]:
+    """
+    Build the analytics trade entry for one selected trade row.
+    
+    :param row: Row with the columns of ``_TRADE_COLUMNS``
+    :return: Dict with the reported trade fields
+    """
+    (
+        trade_id, pair, is_open, open_date, open_rate, close_date, close_rate, amount,
+        stake_amount, profit_abs, profit_percent, enter_tag, exit_reason,
+    ) = row
+    return {
+        'id': trade_id,
+        'pair': pair,
+        'is_open': is_open,
+        'open_date': open_date.isoformat() if open_date else None,
+        'open_rate': open_rate,
+        'close_date': close_date.isoformat() if close_date else None,
+        'close_rate': close_rate,
+        'amount': amount,
+        'stake_amount': stake_amount,
+        'profit_abs': profit_abs,
+        'profit_percent': profit_percent,
+        'duration': (
+            (close_date - open_date).total_seconds() / 60
+            if close_date and open_date else None
+        ),
+        'enter_tag': enter_tag,
+        'exit_reason': exit_reason,
+    }
+
+
 @router.get('/analytics/trades', response_model=list[dict[str, Any]], tags=['analytics'])
-async def analytics_trades(limit: int = 100, rpc: RPC = Depends(get_rpc)):
+async def analytics_trades(
+    limit: int = 100,
+    output_format: Literal['json', 'ndjson'] = Query('json', alias='format'),
+    rpc: RPC = Depends(get_rpc),
+):
     """
     Get detailed trade list for analysis
+    The list is serialized by orjson directly, skipping response model validation.
+    With ``format=ndjson`` the trades are streamed as newline delimited JSON, one trade per
+    line, while the rows are fetched from the database in batches.
     """
     try:
-        trades = Trade.get_trades([]).limit(limit).all()
+        # Latest trades first, ordered and limited by the database. Only the reported
+        # columns are selected, no Trade objects are built.
+        query = (
+            select(*_TRADE_COLUMNS)
+            .order_by(Trade.open_date.desc().nulls_last(), Trade.id.desc())
+            .limit(limit)
+        )
         
-        trade_list = []
-        for t in sorted(trades, key=lambda x: x.open_date or datetime.min, reverse=True):
-            trade_list.append({
-                'id': t.id,
-                'pair': t.pair,
-                'is_open': t.is_open,
-                'open_date': t.open_date.isoformat() if t.open_date else None,
-                'open_rate': t.open_rate,
-                'close_date': t.close_date.isoformat() if t.close_date else None,
-                'close_rate': t.close_rate,
-                'amount': t.amount,
-                'stake_amount': t.stake_amount,
-                'profit_abs': t.close_profit_abs,
-                'profit_percent': t.close_profit,
-                'duration': (t.close_date - t.open_date).total_seconds() / 60 if t.close_date and t.open_date else None,
-                'enter_tag': t.enter_tag,
-                'exit_reason': t.exit_reason,
-            })
+        if output_format == 'ndjson':
+            result = Trade.session.execute(
+                query.execution_options(yield_per=TRADES_STREAM_BATCH)
+            )
+            
+            # Plain generator - Starlette iterates it in the threadpool, so fetching the
+            # batches does not block the event loop
+            def stream_trades():
+                try:
+                    for row in result:
+                        yield orjson.dumps(_trade_row(row)) + b'\n'
+                except Exception:
+                    # The response status is already sent, the stream just ends early
+                    logger.exception("Error streaming trades")
+                finally:
+                    result.close()
+            
+            return StreamingResponse(stream_trades(), media_type='application/x-ndjson')
         
-        return trade_list
+        return FTJSONResponse([_trade_row(row) for row in Trade.session.execute(query)])
         
     except Exception as e:
         logger.exception("Error getting trades")
@@ -1,54 +1,105 @@
 """API endpoints for broker management"""
 
+import asyncio
 import logging
-from typing import Any, Dict, List
+import time
+from functools import lru_cache
+from typing import Any, Callable, Coroutine, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from freqtrade.data.broker_credentials import BrokerCredentialManager
 from freqtrade.exceptions import OperationalException
-from freqtrade.rpc.api_server.deps import get_config, get_rpc_optional
+from freqtrade.rpc.api_server.deps import get_config, get_credential_manager, get_rpc_optional
 from freqtrade.rpc.rpc import RPC, RPCException
+from freqtrade.util import dt_now
 
 
 logger = logging.getLogger(__name__)
 
-# Create the router
-router = APIRouter()
-
 
-@router.get('/brokers', response_model=List[Dict[str, Any]], tags=['brokers'])
-def list_brokers(config=Depends(get_config), rpc: RPC = Depends(get_rpc_optional)):
+class BrokerRoute(APIRoute):
     """
-    List all configured brokers.
+    Route class for the broker endpoints.
+    Unexpected errors raised by an endpoint are logged and answered with a 500 response here,
+    HTTP and validation errors are passed on to FastAPI.
     """
-    try:
-        credential_manager = BrokerCredentialManager(config)
-        brokers = credential_manager.list_brokers()
-        credential_manager.close()
+    
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
         
-        # Add connection status for each broker
-        for broker in brokers:
+        async def broker_route_handler(request: Request) -> Response:
             try:
-                is_valid, message = credential_manager.validate_credentials(broker['broker_name'])
-                broker['connection_status'] = 'connected' if is_valid else 'disconnected'
-                broker['status_message'] = message
+                return await route_handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
             except Exception as e:
-                broker['connection_status'] = 'error'
-                broker['status_message'] = str(e)
-        
-        return brokers
+                logger.exception("Broker endpoint %s failed for %s", self.name, request.path_params)
+                return JSONResponse(status_code=500, content={'detail': str(e)})
         
-    except Exception as e:
-        logger.error(f"Failed to list brokers: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        return broker_route_handler
+
+
+# Create the router
+router = APIRouter(route_class=BrokerRoute)
+
+# Brokers that credentials can be stored for
+SUPPORTED_BROKERS = frozenset({'zerodha', 'smartapi', 'openalgo', 'paperbroker'})
+
+
+@lru_cache(maxsize=1)
+def _iso_now(second: int) -> str:
+    """
+    Current UTC time as ISO string, formatted once per second.
+    
+    :param second: Current unix time in whole seconds (the cache key)
+    :return: ISO formatted timestamp
+    """
+    return dt_now().replace(microsecond=0).isoformat()
+
+
+@router.get('/brokers', response_model=List[Dict[str, Any]], tags=['brokers'])
+async def list_brokers(
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
+    rpc: RPC = Depends(get_rpc_optional)
+):
+    """
+    List all configured brokers.
+    Connection tests for the brokers run concurrently.
+    """
+    loop = asyncio.get_running_loop()
+    brokers = await loop.run_in_executor(None, credential_manager.list_brokers)
+    
+    # Add connection status for each broker
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                None, credential_manager.validate_credentials, broker['broker_name']
+            )
+            for broker in brokers
+        ),
+        return_exceptions=True,
+    )
+    for broker, result in zip(brokers, results):
+        if isinstance(result, Exception):
+            broker['connection_status'] = 'error'
+            broker['status_message'] = str(result)
+        else:
+            is_valid, message = result
+            broker['connection_status'] = 'connected' if is_valid else 'disconnected'
+            broker['status_message'] = message
+    
+    return brokers
 
 
 @router.post('/brokers', tags=['brokers'])
 def add_broker(
     broker_data: Dict[str, Any],
-    config=Depends(get_config),
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
     rpc: RPC = Depends(get_rpc_optional)
 ):
     """
@@ -65,176 +116,130 @@ def add_broker(
         }
     }
     """
-    try:
-        broker_name = broker_data.get('broker_name')
-        credentials = broker_data.get('credentials', {})
-        
-        if not broker_name:
-            raise HTTPException(status_code=400, detail="broker_name is required")
-        
-        if not credentials:
-            raise HTTPException(status_code=400, detail="credentials are required")
-        
-        # Validate broker name
-        supported_brokers = ['zerodha', 'smartapi', 'openalgo', 'paperbroker']
-        if broker_name.lower() not in supported_brokers:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Unsupported broker. Supported brokers: {supported_brokers}"
-            )
-        
-        credential_manager = BrokerCredentialManager(config)
-        success = credential_manager.store_credentials(broker_name, credentials)
+    broker_name = broker_data.get('broker_name')
+    credentials = broker_data.get('credentials', {})
+    
+    if not broker_name:
+        raise HTTPException(status_code=400, detail="broker_name is required")
+    
+    if not credentials:
+        raise HTTPException(status_code=400, detail="credentials are required")
+    
+    # Validate broker name
+    if broker_name.lower() not in SUPPORTED_BROKERS:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Unsupported broker. Supported brokers: {sorted(SUPPORTED_BROKERS)}"
+        )
+    
+    success = credential_manager.store_credentials(broker_name, credentials)
+    
+    if success:
+        # Test connection
+        is_valid, message = credential_manager.validate_credentials(broker_name)
         
-        if success:
-            # Test connection
-            is_valid, message = credential_manager.validate_credentials(broker_name)
-            credential_manager.close()
-            
-            return {
-                "status": "success",
-                "message": f"Broker {broker_name} added successfully",
-                "connection_test": {
-                    "valid": is_valid,
-                    "message": message
-                }
+        return {
+            "status": "success",
+            "message": f"Broker {broker_name} added successfully",
+            "connection_test": {
+                "valid": is_valid,
+                "message": message
             }
-        else:
-            credential_manager.close()
-            raise HTTPException(status_code=500, detail="Failed to store credentials")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to add broker: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        }
+    else:
+        raise HTTPException(status_code=500, detail="Failed to store credentials")
 
 
 @router.put('/brokers/{broker_name}', tags=['brokers'])
 def update_broker(
     broker_name: str,
     credentials: Dict[str, Any],
-    config=Depends(get_config),
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
     rpc: RPC = Depends(get_rpc_optional)
 ):
     """
     Update broker credentials.
     """
-    try:
-        credential_manager = BrokerCredentialManager(config)
-        
-        # Check if broker exists
-        existing_creds = credential_manager.retrieve_credentials(broker_name)
-        if not existing_creds:
-            credential_manager.close()
-            raise HTTPException(status_code=404, detail=f"Broker {broker_name} not found")
-        
-        # Update credentials
-        success = credential_manager.store_credentials(broker_name, credentials)
+    # Check if broker exists
+    existing_creds = credential_manager.retrieve_credentials(broker_name)
+    if not existing_creds:
+        raise HTTPException(status_code=404, detail=f"Broker {broker_name} not found")
+    
+    # Update credentials
+    success = credential_manager.store_credentials(broker_name, credentials)
+    
+    if success:
+        # Test connection
+        is_valid, message = credential_manager.validate_credentials(broker_name)
         
-        if success:
-            # Test connection
-            is_valid, message = credential_manager.validate_credentials(broker_name)
-            credential_manager.close()
-            
-            return {
-                "status": "success",
-                "message": f"Broker {broker_name} updated successfully",
-                "connection_test": {
-                    "valid": is_valid,
-                    "message": message
-                }
+        return {
+            "status": "success",
+            "message": f"Broker {broker_name} updated successfully",
+            "connection_test": {
+                "valid": is_valid,
+                "message": message
             }
-        else:
-            credential_manager.close()
-            raise HTTPException(status_code=500, detail="Failed to update credentials")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to update broker {broker_name}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        }
+    else:
+        raise HTTPException(status_code=500, detail="Failed to update credentials")
 
 
 @router.delete('/brokers/{broker_name}', tags=['brokers'])
 def delete_broker(
     broker_name: str,
-    config=Depends(get_config),
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
     rpc: RPC = Depends(get_rpc_optional)
 ):
     """
     Delete broker credentials.
     """
-    try:
-        credential_manager = BrokerCredentialManager(config)
-        success = credential_manager.delete_credentials(broker_name)
-        credential_manager.close()
-        
-        if success:
-            return {
-                "status": "success",
-                "message": f"Broker {broker_name} deleted successfully"
-            }
-        else:
-            raise HTTPException(status_code=404, detail=f"Broker {broker_name} not found")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete broker {broker_name}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    success = credential_manager.delete_credentials(broker_name)
+    
+    if success:
+        return {
+            "status": "success",
+            "message": f"Broker {broker_name} deleted successfully"
+        }
+    else:
+        raise HTTPException(status_code=404, detail=f"Broker {broker_name} not found")
 
 
 @router.get('/brokers/{broker_name}/status', tags=['brokers'])
 def get_broker_status(
     broker_name: str,
-    config=Depends(get_config),
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
     rpc: RPC = Depends(get_rpc_optional)
 ):
     """
     Check broker connection status.
     """
-    try:
-        credential_manager = BrokerCredentialManager(config)
-        is_valid, message = credential_manager.validate_credentials(broker_name)
-        credential_manager.close()
-        
-        return {
-            "broker_name": broker_name,
-            "status": "connected" if is_valid else "disconnected",
-            "message": message,
-            "timestamp": "2025-10-16T04:59:41+05:30"  # Current timestamp
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to check status for broker {broker_name}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    is_valid, message = credential_manager.validate_credentials(broker_name)
+    
+    return {
+        "broker_name": broker_name,
+        "status": "connected" if is_valid else "disconnected",
+        "message": message,
+        "timestamp": _iso_now(int(time.time()))
+    }
 
 
 @router.post('/brokers/{broker_name}/test', tags=['brokers'])
 def test_broker_connection(
     broker_name: str,
-    config=Depends(get_config),
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
     rpc: RPC = Depends(get_rpc_optional)
 ):
     """
     Test broker connection with stored credentials.
     """
-    try:
-        credential_manager = BrokerCredentialManager(config)
-        is_valid, message = credential_manager.validate_credentials(broker_name)
-        credential_manager.close()
-        
-        return {
-            "broker_name": broker_name,
-            "test_result": "success" if is_valid else "failed",
-            "message": message,
-            "timestamp": "2025-10-16T04:59:41+05:30"
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to test broker {broker_name}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    is_valid, message = credential_manager.validate_credentials(broker_name, use_cache=False)
+    
+    return {
+        "broker_name": broker_name,
+        "test_result": "success" if is_valid else "failed",
+        "message": message,
+        "timestamp": _iso_now(int(time.time()))
+    }
 
 
 @router.get('/brokers/{broker_name}/balance', tags=['brokers'])
@@ -246,29 +251,22 @@ def get_broker_balance(
     """
     Get broker account balance.
     """
-    try:
-        if not rpc:
-            raise HTTPException(status_code=503, detail="Bot is not running")
-        
-        # This would need to be implemented in the RPC layer
-        # For now, return a placeholder response
-        return {
-            "broker_name": broker_name,
-            "balance": {
-                "available_cash": 0.0,
-                "used_margin": 0.0,
-                "total_balance": 0.0,
-                "currency": "INR"
-            },
-            "message": "Balance retrieval not fully implemented",
-            "timestamp": "2025-10-16T04:59:41+05:30"
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get balance for broker {broker_name}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if not rpc:
+        raise HTTPException(status_code=503, detail="Bot is not running")
+    
+    # This would need to be implemented in the RPC layer
+    # For now, return a placeholder response
+    return {
+        "broker_name": broker_name,
+        "balance": {
+            "available_cash": 0.0,
+            "used_margin": 0.0,
+            "total_balance": 0.0,
+            "currency": "INR"
+        },
+        "message": "Balance retrieval not fully implemented",
+        "timestamp": _iso_now(int(time.time()))
+    }
 
 
 @router.get('/brokers/{broker_name}/positions', tags=['brokers'])
@@ -280,49 +278,33 @@ def get_broker_positions(
     """
     Get broker positions.
     """
-    try:
-        if not rpc:
-            raise HTTPException(status_code=503, detail="Bot is not running")
-        
-        # This would need to be implemented in the RPC layer
-        # For now, return a placeholder response
-        return {
-            "broker_name": broker_name,
-            "positions": [],
-            "message": "Position retrieval not fully implemented",
-            "timestamp": "2025-10-16T04:59:41+05:30"
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get positions for broker {broker_name}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if not rpc:
+        raise HTTPException(status_code=503, detail="Bot is not running")
+    
+    # This would need to be implemented in the RPC layer
+    # For now, return a placeholder response
+    return {
+        "broker_name": broker_name,
+        "positions": [],
+        "message": "Position retrieval not fully implemented",
+        "timestamp": _iso_now(int(time.time()))
+    }
 
 
 @router.post('/brokers/rotate-key', tags=['brokers'])
 def rotate_encryption_key(
-    config=Depends(get_config),
+    credential_manager: BrokerCredentialManager = Depends(get_credential_manager),
     rpc: RPC = Depends(get_rpc_optional)
 ):
     """
     Rotate encryption key for broker credentials.
     """
-    try:
-        credential_manager = BrokerCredentialManager(config)
-        success = credential_manager.rotate_encryption_key()
-        credential_manager.close()
-        
-        if success:
-            return {
-                "status": "success",
-                "message": "Encryption key rotated successfully"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to rotate encryption key")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to rotate encryption key: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    success = credential_manager.rotate_encryption_key()
+    
+    if success:
+        return {
+            "status": "success",
+            "message": "Encryption key rotated successfully"
+        }
+    else:
+        raise HTTPException(status_code=500, detail="Failed to rotate encryption key")
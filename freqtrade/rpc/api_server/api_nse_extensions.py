@@ -329,14 +329,16 @@ def reset_paper_broker(exchange=Depends(get_exchange)):
         # Clear orders
         if hasattr(exchange, '_orders'):
             exchange._orders.clear()
-        if hasattr(exchange, '_open_orders'):
-            exchange._open_orders.clear()
-        if hasattr(exchange, '_filled_orders'):
-            exchange._filled_orders.clear()
+        if hasattr(exchange, '_open_order_ids'):
+            exchange._open_order_ids.clear()
+        if hasattr(exchange, '_filled_order_ids'):
+            exchange._filled_order_ids.clear()
         if hasattr(exchange, '_positions'):
             exchange._positions.clear()
         if hasattr(exchange, '_trade_history'):
             exchange._trade_history.clear()
+        if hasattr(exchange, '_invalidate_balance'):
+            exchange._invalidate_balance()
 
         return {
             'status': 'success',
@@ -61,6 +61,15 @@ def get_exchange(config=Depends(get_config)):
     return exchange
 
 
+def get_credential_manager(config=Depends(get_config)):
+    if not (credential_manager := ApiBG.credential_manager):
+        from freqtrade.data.broker_credentials import BrokerCredentialManager
+
+        credential_manager = BrokerCredentialManager(config)
+        ApiBG.credential_manager = credential_manager
+    return credential_manager
+
+
 def get_message_stream():
     return ApiServer._message_stream
 
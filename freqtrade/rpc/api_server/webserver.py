@@ -89,6 +89,9 @@ class ApiServer(RPCHandler):
         del ApiServer._rpc
         ApiBG.exchanges = {}
         ApiBG.jobs = {}
+        if ApiBG.credential_manager:
+            ApiBG.credential_manager.close()
+            ApiBG.credential_manager = None
         if self._server and not self._standalone:
             logger.info("Stopping API Server")
             # self._server.force_exit, self._server.should_exit = True, True
@@ -1,4 +1,4 @@
-from typing import Any, Literal, NotRequired
+from typing import TYPE_CHECKING, Any, Literal, NotRequired
 from uuid import uuid4
 
 from typing_extensions import TypedDict
@@ -6,6 +6,10 @@ from typing_extensions import TypedDict
 from freqtrade.exchange.exchange import Exchange
 
 
+if TYPE_CHECKING:
+    from freqtrade.data.broker_credentials import BrokerCredentialManager
+
+
 class ProgressTask(TypedDict):
     progress: float
     total: float
@@ -34,6 +38,8 @@ class ApiBG:
     bgtask_running: bool = False
     # Exchange - only available in webserver mode.
     exchanges: dict[str, Exchange] = {}
+    # Broker credential manager - shared by the broker endpoints.
+    credential_manager: "BrokerCredentialManager | None" = None
 
     # Generic background jobs
 
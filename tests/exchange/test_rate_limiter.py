@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from freqtrade.exchange.rate_limiter import BrokerRateLimits, EndpointRateLimiter, RateLimiter
+
+
+@pytest.fixture
+def sleep_mock(mocker):
+    return mocker.patch("freqtrade.exchange.rate_limiter.time.sleep", MagicMock())
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = MagicMock(return_value=1000.0)
+    mocker.patch("freqtrade.exchange.rate_limiter.time.monotonic", clock)
+    return clock
+
+
+def test_rate_limiter_per_second(clock, sleep_mock):
+    limiter = RateLimiter(requests_per_second=2)
+
+    assert limiter.wait_if_needed() == 0.0
+    assert limiter.wait_if_needed() == 0.0
+    # Third request within the same second waits until the oldest one expired
+    assert limiter.wait_if_needed() == pytest.approx(1.01)
+    sleep_mock.assert_called_once_with(pytest.approx(1.01))
+
+    stats = limiter.get_stats()
+    assert stats["total_requests"] == 3
+    assert stats["rate_limit_hits"] == 1
+
+
+def test_rate_limiter_min_interval(clock, sleep_mock):
+    limiter = RateLimiter(min_request_interval=0.2)
+
+    assert limiter.wait_if_needed() == 0.0
+    clock.return_value += 0.05
+    assert limiter.wait_if_needed() == pytest.approx(0.15)
+    clock.return_value += 1
+    assert limiter.wait_if_needed() == 0.0
+    assert sleep_mock.call_count == 1
+
+
+def test_endpoint_rate_limiter_single_sleep(clock, sleep_mock):
+    default = RateLimiter(min_request_interval=0.5)
+    limiter = EndpointRateLimiter(default)
+    limiter.add_endpoint_limit("quote", requests_per_second=1)
+
+    assert limiter.wait_if_needed("quote") == 0.0
+    clock.return_value += 0.1
+
+    # Both limits are exceeded - one sleep covers the longer of the two waits
+    assert limiter.wait_if_needed("quote") == pytest.approx(0.91)
+    sleep_mock.assert_called_once_with(pytest.approx(0.91))
+
+    stats = limiter.get_stats()
+    assert stats["default"]["total_requests"] == 2
+    assert stats["default"]["rate_limit_hits"] == 1
+    assert stats["default"]["total_wait_time"] == pytest.approx(0.4)
+    assert stats["endpoints"]["quote"]["total_requests"] == 2
+    assert stats["endpoints"]["quote"]["rate_limit_hits"] == 1
+    assert stats["endpoints"]["quote"]["total_wait_time"] == pytest.approx(0.91)
+
+
+def test_endpoint_rate_limiter_default_only(clock, sleep_mock):
+    default = RateLimiter(requests_per_second=1)
+    limiter = EndpointRateLimiter(default)
+    limiter.add_endpoint_limit("quote", requests_per_second=10)
+
+    # Endpoints without a specific limit and requests without an endpoint use the default
+    assert limiter.wait_if_needed("unknown") == 0.0
+    assert limiter.wait_if_needed() == pytest.approx(1.01)
+    # The endpoint limit allows it, the shared default limit does not
+    assert limiter.wait_if_needed("quote") == pytest.approx(1.01)
+    assert sleep_mock.call_count == 2
+
+    stats = limiter.get_stats()
+    assert stats["default"]["total_requests"] == 3
+    assert stats["endpoints"]["quote"]["total_requests"] == 1
+    assert stats["endpoints"]["quote"]["rate_limit_hits"] == 0
+
+
+def test_broker_endpoint_limiter():
+    limiter = BrokerRateLimits.get_endpoint_limiter("smartapi")
+    stats = limiter.get_stats()
+    assert set(stats["endpoints"]) == set(BrokerRateLimits.SMARTAPI_ENDPOINTS)
+
+    limiter = BrokerRateLimits.get_endpoint_limiter("openalgo")
+    assert limiter.get_stats()["endpoints"] == {}
@@ -10,6 +10,7 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import orjson
 import pandas as pd
 import pytest
 import rapidjson
@@ -27,7 +28,7 @@ from freqtrade.loggers import setup_logging, setup_logging_pre
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import CustomDataWrapper, Trade
 from freqtrade.rpc import RPC
-from freqtrade.rpc.api_server import ApiServer
+from freqtrade.rpc.api_server import ApiServer, api_analytics
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
@@ -3355,3 +3356,124 @@ def test_api_markets_webserver(botclient):
 
     assert "hyperliquid_spot" in ApiBG.exchanges
     assert "binance_spot" in ApiBG.exchanges
+
+
+def create_analytics_trades(fee):
+    """
+    Closed trades over three days (win, win, no profit, loss, loss) plus one open trade.
+    """
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    # (open offset, duration, close_profit_abs)
+    closed = [
+        (timedelta(hours=10), timedelta(minutes=60), 10.0),
+        (timedelta(hours=12), timedelta(minutes=30), 5.0),
+        (timedelta(days=1, hours=9), timedelta(minutes=120), None),
+        (timedelta(days=1, hours=12), timedelta(minutes=90), -4.0),
+        (timedelta(days=2, hours=8), timedelta(minutes=15), -1.0),
+    ]
+    for idx, (open_offset, duration, profit) in enumerate(closed):
+        Trade.session.add(
+            Trade(
+                pair=f"PAIR{idx}/INR",
+                stake_amount=100.0,
+                amount=1.0,
+                fee_open=fee.return_value,
+                fee_close=fee.return_value,
+                is_open=False,
+                open_date=start + open_offset,
+                close_date=start + open_offset + duration,
+                open_rate=100.0,
+                close_rate=100.0 + (profit or 0),
+                close_profit_abs=profit,
+                close_profit=(profit or 0) / 100,
+                exchange="paperbroker",
+                strategy="StrategyTestV3",
+                timeframe=5,
+            )
+        )
+    Trade.session.add(
+        Trade(
+            pair="OPEN/INR",
+            stake_amount=100.0,
+            amount=1.0,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            is_open=True,
+            open_date=start + timedelta(days=2, hours=9),
+            open_rate=100.0,
+            exchange="paperbroker",
+            strategy="StrategyTestV3",
+            timeframe=5,
+        )
+    )
+    Trade.commit()
+
+
+def test_api_analytics_overview_empty(botclient):
+    _ftbot, client = botclient
+    api_analytics._overview_cache.clear()
+
+    rc = client_get(client, f"{BASE_URI}/analytics/overview")
+    assert_response(rc)
+    response = rc.json()
+    assert response["total_trades"] == 0
+    assert response["best_trade"] is None
+    assert response["equity_curve"] == []
+
+
+def test_api_analytics_overview(botclient, fee):
+    _ftbot, client = botclient
+    api_analytics._overview_cache.clear()
+    create_analytics_trades(fee)
+
+    rc = client_get(client, f"{BASE_URI}/analytics/overview")
+    assert_response(rc)
+    response = rc.json()
+
+    assert response["total_trades"] == 6
+    assert response["open_trades"] == 1
+    assert response["closed_trades"] == 5
+    # A trade without close_profit_abs counts as a loss with 0 profit
+    assert response["winning_trades"] == 2
+    assert response["losing_trades"] == 3
+    assert response["total_profit"] == 10.0
+    assert response["total_profit_percent"] == 0.01
+    assert response["win_rate"] == 40.0
+    assert response["avg_profit"] == 2.0
+    assert response["avg_profit_winning"] == 7.5
+    assert response["avg_profit_losing"] == -1.67
+    assert response["avg_duration"] == pytest.approx(63.0)
+    assert response["max_win_streak"] == 2
+    assert response["max_loss_streak"] == 3
+
+    assert response["best_trade"]["pair"] == "PAIR0/INR"
+    assert response["best_trade"]["profit"] == 10.0
+    assert response["worst_trade"]["pair"] == "PAIR3/INR"
+    assert response["worst_trade"]["profit"] == -4.0
+
+    assert [e["profit"] for e in response["equity_curve"]] == [10.0, 15.0, 15.0, 11.0, 10.0]
+    assert [e["pair"] for e in response["equity_curve"]] == [f"PAIR{i}/INR" for i in range(5)]
+    assert response["daily_profit"] == [
+        {"date": "2024-01-01", "profit": 15.0},
+        {"date": "2024-01-02", "profit": -4.0},
+        {"date": "2024-01-03", "profit": -1.0},
+    ]
+    assert "current_balance" in response
+    assert rc.headers["cache-control"] == f"private, max-age={api_analytics.OVERVIEW_CACHE_TTL}"
+
+
+def test_api_analytics_trades(botclient, fee):
+    _ftbot, client = botclient
+    create_analytics_trades(fee)
+
+    rc = client_get(client, f"{BASE_URI}/analytics/trades?limit=3")
+    assert_response(rc)
+    response = rc.json()
+    assert [t["pair"] for t in response] == ["OPEN/INR", "PAIR4/INR", "PAIR3/INR"]
+    assert response[0]["duration"] is None
+    assert response[1]["duration"] == 15.0
+
+    rc = client_get(client, f"{BASE_URI}/analytics/trades?limit=3&format=ndjson")
+    assert rc.status_code == 200
+    assert rc.headers["content-type"] == "application/x-ndjson"
+    assert [orjson.loads(line) for line in rc.content.splitlines()] == response